@@ -1,6 +1,14 @@
-from ui.main_window import MainWindow
+import sys
 
-def main():
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "render":
+        # Headless batch rendering; never loads the UI or audio device
+        from batch import main as render_main
+        return render_main(argv[1:])
+
+    from ui.main_window import MainWindow
     try:
         MainWindow().run()
     except Exception:
@@ -8,4 +16,4 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
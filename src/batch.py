@@ -0,0 +1,335 @@
+"""
+Headless batch rendering for Noise Studio.
+
+Renders preset files or parameter sweeps to disk on a process pool,
+through the engine and `NoiseExporter`, without a display or audio
+device: nothing here imports dearpygui or sounddevice.
+
+Usage:
+    python src/app.py render presets/*.json --workers 4
+    python src/batch.py --kind image --noise-type perlin,worley \\
+        --seeds 1-8 --param scale=2,4,8 --width 2048 --height 2048
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from engine.audio_noise import AUDIO_NOISE_TYPES, DEFAULT_STREAM_BLOCK, AudioNoiseGenerator
+from engine.image_noise import SPECTRAL_BETAS, TILEABLE_NOISE_TYPES, ImageNoiseGenerator
+from export.exporter import NoiseExporter
+from export.presets import load_preset
+
+
+# Settings of a render job, and their defaults.
+JOB_DEFAULTS = {
+    "kind": "image",
+    # "perlin" for images and "white" for audio when None
+    "noise_type": None,
+    "seed": None,
+    "params": {},
+    # Image jobs
+    "width": 512,
+    "height": 512,
+    "format": "png",
+    "tiled": False,
+    # Audio jobs
+    "sample_rate": 44100,
+    "duration": 10.0,
+    "channels": 1,
+    "correlation": 0.0,
+    "dither": False,
+    # 8 for images and 16 for audio when None
+    "bit_depth": None,
+}
+
+# Tile edge used to stream tileable image types to disk.
+BATCH_TILE_SIZE = 512
+
+
+def make_job(settings: Dict[str, Any], name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Return a complete job from (partial) `settings`, e.g. a loaded preset.
+
+    The job is named after `settings["name"]`, else `name`; unnamed jobs
+    are named after their settings by `expand_sweep`.
+    """
+    unknown = set(settings) - set(JOB_DEFAULTS) - {"name"}
+    if unknown:
+        raise ValueError(f"Unknown job settings: {', '.join(sorted(unknown))}.")
+    job = dict(JOB_DEFAULTS, params={})
+    job.update(settings)
+    job["params"] = dict(job["params"])
+    if job["kind"] not in ("image", "audio"):
+        raise ValueError(f"Unknown job kind '{job['kind']}'.")
+    if job["noise_type"] is None:
+        job["noise_type"] = "perlin" if job["kind"] == "image" else "white"
+    if job["bit_depth"] is None:
+        job["bit_depth"] = 8 if job["kind"] == "image" else 16
+    job["name"] = settings.get("name") or name
+    return job
+
+
+def job_name(job: Dict[str, Any]) -> str:
+    """
+    Return a file name describing a job, e.g. ``image_perlin_seed3_scale4``.
+    """
+    parts = [job["kind"], job["noise_type"], f"seed{job['seed']}"]
+    parts += [f"{key}{value}" for key, value in sorted(job["params"].items())]
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", "_".join(str(p) for p in parts))
+
+
+def expand_sweep(
+    base_jobs: Sequence[Dict[str, Any]],
+    noise_types: Optional[Sequence[str]] = None,
+    seeds: Optional[Sequence[Optional[int]]] = None,
+    params: Optional[Dict[str, Sequence[Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return one job per combination of the sweep axes for every base job.
+
+    Axes left as None keep the base job's value. A named base job that
+    expands to several jobs gets their settings appended to its name.
+    """
+    params = params or {}
+    jobs = []
+    for base in base_jobs:
+        axes = [
+            noise_types if noise_types is not None else [base["noise_type"]],
+            seeds if seeds is not None else [base["seed"]],
+        ] + [list(values) for values in params.values()]
+        combos = list(itertools.product(*axes))
+        for noise_type, seed, *values in combos:
+            job = dict(base, noise_type=noise_type, seed=seed)
+            job["params"] = dict(base["params"], **dict(zip(params, values)))
+            if base["name"] is None:
+                job["name"] = job_name(job)
+            elif len(combos) > 1:
+                job["name"] = f"{base['name']}_{job_name(job)}"
+            jobs.append(job)
+    return jobs
+
+
+def render_job(job: Dict[str, Any], output_directory: str) -> Dict[str, Any]:
+    """
+    Render one job to disk; process-pool worker.
+
+    Tileable images and all audio stream to the exporter, so memory use
+    does not grow with the output size. Audio `params` may set
+    ``density`` (velvet) and ``frequencies``/``magnitudes`` (shaped).
+
+    Returns
+    -------
+    dict
+        ``name``, ``path``, ``pixels`` or ``samples`` rendered and
+        ``seconds`` taken
+    """
+    start = time.perf_counter()
+    exporter = NoiseExporter(Path(output_directory))
+    params = dict(job["params"])
+    result = {"name": job["name"], "pixels": 0, "samples": 0}
+
+    if job["kind"] == "image":
+        width, height = job["width"], job["height"]
+        gen = ImageNoiseGenerator(width, height, seed=job["seed"])
+        if job["noise_type"] in TILEABLE_NOISE_TYPES:
+            image = gen.iter_tiles(job["noise_type"], BATCH_TILE_SIZE, np.float32, **params)
+        elif job["noise_type"] in SPECTRAL_BETAS:
+            # Spectral noise needs the whole canvas for its FFT
+            beta = params.pop("beta", SPECTRAL_BETAS[job["noise_type"]])
+            if params:
+                raise ValueError(f"Unknown image parameters: {', '.join(sorted(params))}.")
+            image = gen.generate_colored_noise(beta, dtype=np.float32)
+        else:
+            raise ValueError(f"Unknown noise type '{job['noise_type']}'.")
+        path = exporter.export_image(
+            image, job["name"], job["format"], job["bit_depth"],
+            width=width, height=height, tiled=job["tiled"],
+        )
+        result["pixels"] = width * height
+    else:
+        if job["noise_type"] not in AUDIO_NOISE_TYPES:
+            raise ValueError(f"Unknown noise type '{job['noise_type']}'.")
+        gen = AudioNoiseGenerator(job["sample_rate"], job["seed"], job["channels"], job["correlation"])
+        if "density" in params:
+            gen.velvet_density = params.pop("density")
+        if "frequencies" in params:
+            gen.set_spectral_curve(params.pop("frequencies"), params.pop("magnitudes"))
+        if params:
+            raise ValueError(f"Unknown audio parameters: {', '.join(sorted(params))}.")
+        samples = int(job["sample_rate"] * job["duration"])
+        blocks = gen.stream(DEFAULT_STREAM_BLOCK, job["noise_type"], samples)
+        path = exporter.export_audio(
+            (np.clip(block, -1.0, 1.0, out=block) for block in blocks),
+            job["name"], job["sample_rate"], bit_depth=job["bit_depth"], dither=job["dither"],
+        )
+        result["samples"] = samples * job["channels"]
+
+    result["path"] = str(path)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def run_jobs(
+    jobs: Sequence[Dict[str, Any]],
+    output_directory: Path,
+    workers: int = 1,
+    log=print,
+) -> List[Dict[str, Any]]:
+    """
+    Render `jobs` on `workers` processes, logging progress and throughput.
+
+    Returns the job results in completion order; a job that failed is
+    logged and its result carries an ``error`` entry instead.
+    """
+    output_directory = Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+    results = []
+    start = time.perf_counter()
+
+    def report(job, outcome):
+        done = len(results)
+        if "error" in outcome:
+            log(f"[{done}/{len(jobs)}] FAILED {job['name']}: {outcome['error']}")
+        else:
+            log(f"[{done}/{len(jobs)}] {job['name']} ({outcome['seconds']:.2f}s) -> {outcome['path']}")
+
+    if workers <= 1:
+        for job in jobs:
+            try:
+                outcome = render_job(job, str(output_directory))
+            except Exception as exc:
+                outcome = {"name": job["name"], "error": exc}
+            results.append(outcome)
+            report(job, outcome)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(render_job, job, str(output_directory)): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as exc:
+                    outcome = {"name": job["name"], "error": exc}
+                results.append(outcome)
+                report(job, outcome)
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    succeeded = [r for r in results if "error" not in r]
+    pixels = sum(r["pixels"] for r in succeeded)
+    samples = sum(r["samples"] for r in succeeded)
+    log(
+        f"Rendered {len(succeeded)}/{len(jobs)} jobs in {elapsed:.2f}s "
+        f"({len(succeeded) / elapsed:.2f} jobs/s, {pixels / elapsed / 1e6:.1f} Mpx/s, "
+        f"{samples / elapsed / 1e6:.1f} Msamples/s)"
+    )
+    return results
+
+
+def parse_seeds(text: str) -> List[Optional[int]]:
+    """
+    Parse a seed list such as ``1-4,9``; ``none`` stands for an unseeded render.
+    """
+    seeds = []
+    for part in text.split(","):
+        part = part.strip()
+        if part.lower() == "none":
+            seeds.append(None)
+        elif re.fullmatch(r"\d+-\d+", part):
+            first, last = (int(v) for v in part.split("-"))
+            seeds.extend(range(first, last + 1))
+        else:
+            seeds.append(int(part))
+    return seeds
+
+
+def parse_param(text: str):
+    """
+    Parse ``name=v1,v2,...`` into the name and its values (JSON or text).
+    """
+    name, sep, values = text.partition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"Expected name=values, got '{text}'.")
+
+    def parse_value(value: str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+
+    return name, [parse_value(v) for v in values.split(",")]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="noise-studio render",
+        description="Render noise presets or parameter sweeps without the UI.",
+    )
+    parser.add_argument("presets", nargs="*", type=Path, help="Preset JSON files (see export/presets.py)")
+    parser.add_argument("--kind", choices=("image", "audio"), help="Job kind when no presets are given")
+    parser.add_argument("--noise-type", help="Noise type(s), comma separated")
+    parser.add_argument("--seeds", type=parse_seeds, help="Seeds, e.g. 1-8,12")
+    parser.add_argument("--param", type=parse_param, action="append", default=[],
+                        help="Parameter sweep, e.g. scale=2,4,8 (repeatable)")
+    parser.add_argument("--width", type=int)
+    parser.add_argument("--height", type=int)
+    parser.add_argument("--format", dest="format", help="Image format: png or tiff")
+    parser.add_argument("--tiled", action="store_true", default=None, help="Write tiled TIFF")
+    parser.add_argument("--sample-rate", type=int)
+    parser.add_argument("--duration", type=float, help="Audio length in seconds")
+    parser.add_argument("--channels", type=int)
+    parser.add_argument("--correlation", type=float)
+    parser.add_argument("--dither", action="store_true", default=None, help="TPDF dither audio")
+    parser.add_argument("--bit-depth", type=int)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", type=Path, help="Output directory")
+    return parser
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    args = build_parser().parse_args(None if argv is None else list(argv))
+
+    # Explicit options override preset settings
+    overrides = {
+        key: getattr(args, key)
+        for key in ("kind", "width", "height", "format", "tiled", "sample_rate",
+                    "duration", "channels", "correlation", "dither", "bit_depth")
+        if getattr(args, key) is not None
+    }
+    try:
+        if args.presets:
+            base_jobs = [
+                make_job(dict(load_preset(path), **overrides), name=path.stem)
+                for path in args.presets
+            ]
+        else:
+            base_jobs = [make_job(overrides)]
+        jobs = expand_sweep(
+            base_jobs,
+            noise_types=args.noise_type.split(",") if args.noise_type else None,
+            seeds=args.seeds,
+            params=dict(args.param),
+        )
+    except (OSError, ValueError) as exc:
+        print(f"Invalid batch: {exc}", file=sys.stderr)
+        return 2
+
+    output = args.output
+    if output is None:
+        from utils.config import get_app_dirs
+        output = get_app_dirs()["base"] / "output" / "batch"
+    results = run_jobs(jobs, output, workers=args.workers)
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
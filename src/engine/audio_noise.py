@@ -5,58 +5,1199 @@ Responsible for generating procedural audio noise
 such as white, pink, brown, and advanced noise types.
 """
 
+import atexit
+import threading
+
 import numpy as np
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Sequence, Tuple
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # scipy is optional; only the filtered noise types need it
+    lfilter = None
+
+from .noise_common import (
+    counter_key,
+    CounterStreams,
+    counter_uniform,
+    counter_words,
+    counter_words_batch,
+    create_numpy_rng,
+    prepare_output,
+    seed_entropy,
+)
+
+
+# Three-pole IIR approximation of a -3 dB/octave (1/f) slope, accurate
+# to about 0.05 dB from 9 Hz upwards at 44.1 kHz (J. O. Smith).
+PINK_B = np.array([0.049922035, -0.095993537, 0.050612699, -0.004408786])
+PINK_A = np.array([1.0, -2.494956002, 2.017265875, -0.522189400])
+
+# Brings filtered uniform white noise to peaks near +/-1.
+PINK_GAIN = 4.0
+
+# Corner of the brown integrator's leak; lower frequencies are rolled off
+# so long renders do not drift away from zero.
+BROWN_DC_CUTOFF_HZ = 5.0
+
+# Standard deviation of the brown output, which keeps peaks near +/-1.
+BROWN_LEVEL = 0.25
+
+# Integration sub-block length. Sub-blocks are aligned to absolute sample
+# indices so any split into calls performs the same arithmetic.
+BROWN_BLOCK = 4096
+
+# Default block length for `AudioNoiseGenerator.stream`.
+DEFAULT_STREAM_BLOCK = 4096
+
+# Samples per segment of a parallel render. Segments start at multiples of
+# this (itself a multiple of BROWN_BLOCK), so the split, and therefore the
+# result, never depends on the worker count.
+PARALLEL_SEGMENT = 1 << 18
+
+# Samples (over all seeds and channels) per step of a batch render, so
+# the temporaries of each step stay in cache.
+BATCH_BLOCK_WORDS = 1 << 16
+
+# A filter's free (zero-input) response is dropped once every pole has
+# decayed below this factor; the cut-off depends only on the filter.
+_FREE_RESPONSE_FLOOR = 1e-20
+
+# Default velvet noise density in pulses per second.
+DEFAULT_VELVET_DENSITY = 2000.0
+
+# Counter-stream namespace for velvet pulses, apart from the channel streams.
+_VELVET_STREAM = 1 << 20
+
+# Length of the spectral shaping FIR kernel. Odd, so the linear-phase
+# kernel is symmetric about its centre tap; about 23 Hz resolution at 48 kHz.
+SHAPED_TAPS = 2049
+
+# FFT length of the shaping frames. Each frame yields
+# SHAPED_FFT - SHAPED_TAPS + 1 output samples.
+SHAPED_FFT = 8192
 
-from .noise_common import create_numpy_rng
+# Output samples per shaping frame. Frames sit at multiples of this, so
+# the shaped signal depends only on the sample index.
+SHAPED_HOP = SHAPED_FFT - SHAPED_TAPS + 1
+
+# Standard deviation of shaped noise for any curve, as for brown noise.
+SHAPED_LEVEL = 0.25
+
+# Noise types accepted by `AudioNoiseGenerator.generate_batch`.
+AUDIO_NOISE_TYPES = ("white", "pink", "brown", "velvet", "shaped")
+
+# Noise types whose filter state carries from one sample to the next.
+_FILTERED_NOISE_TYPES = ("pink", "brown")
+
+
+def _brown_leak(sample_rate: int) -> float:
+    """
+    Per-sample decay of the brown integrator.
+    """
+    return float(np.exp(-2.0 * np.pi * BROWN_DC_CUTOFF_HZ / sample_rate))
+
+
+@lru_cache(maxsize=8)
+def _brown_weights(sample_rate: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the brown integrator's per-step weights and output gains.
+
+    For sub-block offset ``i``, ``weights[i] = step * leak^-(i+1)`` and
+    ``gains[i] = leak^(i+1)``.
+    """
+    leak = _brown_leak(sample_rate)
+    # Uniform [-1, 1) steps have variance 1/3; scale to BROWN_LEVEL.
+    step = BROWN_LEVEL * np.sqrt(3.0 * (1.0 - leak * leak))
+    exponents = np.arange(1, BROWN_BLOCK + 1)
+    weights = step * leak ** -exponents
+    gains = leak ** exponents
+    weights.flags.writeable = False
+    gains.flags.writeable = False
+    return weights, gains
+
+
+@lru_cache(maxsize=8)
+def _free_response_model(noise_type: str, sample_rate: int):
+    """
+    Describe the zero-input response of a filtered noise type's state.
+
+    The filters are linear, so a segment rendered from rest only lacks
+    the free response of the state it should have started with. For
+    distinct poles ``p`` that response is ``sum_i r_i * p_i^k``.
+
+    Returns
+    -------
+    tuple
+        ``(poles, to_residues, to_state, powers)``: ``to_residues`` maps a
+        state to the residues ``r``; ``to_state`` maps the next
+        ``len(poles)`` free outputs back to a state; ``powers[k, i]`` is
+        ``p_i^k`` up to where every pole has decayed away, scaled by the
+        output gain of the noise type.
+    """
+    if noise_type == "pink":
+        order = len(PINK_A) - 1
+        poles = np.roots(PINK_A).real
+        # Column j: the first `order` outputs produced by unit state j
+        to_outputs = np.column_stack([
+            lfilter(PINK_B, PINK_A, np.zeros(order), zi=np.eye(order)[j])[0]
+            for j in range(order)
+        ])
+        gain = PINK_GAIN
+    else:
+        # The brown state is the previous output y; its next output is leak * y
+        leak = _brown_leak(sample_rate)
+        poles = np.array([leak])
+        to_outputs = np.array([[leak]])
+        gain = 1.0
+
+    vandermonde = poles[None, :] ** np.arange(len(poles))[:, None]
+    to_residues = np.linalg.solve(vandermonde, to_outputs)
+    to_state = np.linalg.inv(to_outputs)
+    length = min(
+        PARALLEL_SEGMENT,
+        int(np.ceil(np.log(_FREE_RESPONSE_FLOOR) / np.log(np.abs(poles).max()))),
+    )
+    powers = gain * poles[None, :] ** np.arange(length)[:, None]
+    return poles, to_residues, to_state, powers
+
+
+@lru_cache(maxsize=8)
+def _shaping_spectrum(
+    sample_rate: int,
+    curve: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]],
+) -> np.ndarray:
+    """
+    Return the SHAPED_FFT-point spectrum of the shaping kernel for `curve`.
+
+    The kernel is designed by frequency sampling: the curve is
+    interpolated onto an FFT grid, turned into a zero-phase response,
+    centred to make it linear-phase and Hann-windowed. It is scaled so
+    uniform [-1, 1) input comes out with a standard deviation of
+    `SHAPED_LEVEL`. A None curve is flat.
+    """
+    grid = np.fft.rfftfreq(SHAPED_TAPS - 1, 1.0 / sample_rate)
+    if curve is None:
+        magnitudes = np.ones_like(grid)
+    else:
+        magnitudes = np.interp(grid, *curve)
+    zero_phase = np.fft.irfft(magnitudes, SHAPED_TAPS - 1)
+    kernel = zero_phase[(np.arange(SHAPED_TAPS) - SHAPED_TAPS // 2) % (SHAPED_TAPS - 1)]
+    kernel *= np.hanning(SHAPED_TAPS)
+    # Uniform [-1, 1) input has variance 1/3
+    kernel *= SHAPED_LEVEL * np.sqrt(3.0 / np.sum(kernel * kernel))
+    spectrum = np.fft.rfft(kernel, SHAPED_FFT)
+    spectrum.flags.writeable = False
+    return spectrum
+
+
+def velvet_pulses(
+    key: int,
+    start: int,
+    count: int,
+    period: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the velvet-noise pulses inside samples ``start .. start + count``.
+
+    Pulse ``m`` sits inside the grid cell ``[m * period, (m + 1) * period)``.
+    Word ``m`` of the counter stream gives its position (top 32 bits)
+    and sign (lowest bit), so any range is computed directly, in
+    O(pulses), and always agrees with a longer range.
+
+    Parameters
+    ----------
+    key : int
+        Stream key from `counter_key`
+    start, count : int
+        Sample range
+    period : float
+        Samples per pulse (sample rate / density), at least 1
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(indices, signs)``: int64 absolute sample indices in ascending
+        order and int8 signs of +/-1
+    """
+    first = int(start // period)
+    last = int(np.ceil((start + count) / period))
+    edges = np.floor(np.arange(first, last + 1) * period).astype(np.int64)
+    indices, signs = _velvet_decode(counter_words(key, first, last - first), edges)
+    # Pulses are sorted, so only the cells at either end can fall outside
+    lo, hi = np.searchsorted(indices, (start, start + count))
+    return indices[lo:hi], signs[lo:hi]
+
+
+def _velvet_decode(
+    words: np.ndarray,
+    edges: np.ndarray,
+    dtype=np.int8,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Turn the words of consecutive grid cells (last axis) into pulse
+    indices and signs of `dtype`; `edges` holds the cell boundaries.
+
+    The offset into a cell is the top 32 bits of the word scaled by the
+    cell width, in integer arithmetic throughout.
+    """
+    offsets = (words >> np.uint64(32)).view(np.int64)
+    offsets *= edges[1:] - edges[:-1]
+    offsets >>= 32
+    offsets += edges[:-1]
+    signs = (words & np.uint64(1)).astype(dtype)
+    signs += signs
+    signs -= 1
+    return offsets, signs
+
+
+def _velvet_cell(sample: int, period: float) -> int:
+    """
+    Return the grid cell ``m`` whose samples
+    ``floor(m * period) .. floor((m + 1) * period)`` contain `sample`.
+    """
+    cell = int(sample // period)
+    if int((cell + 1) * period) <= sample:
+        cell += 1
+    return cell
+
+
+def _leaky_integrate(
+    steps: np.ndarray,
+    start: int,
+    total: np.ndarray,
+    sample_rate: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Run the brown integrator over `steps` along axis 0 into `out`.
+
+    `start` is the absolute position of the first step, which aligns
+    the `BROWN_BLOCK` sub-blocks, and `total` the carried running sum
+    (shape ``steps.shape[1:]``). Returns the running sum to carry on.
+    """
+    num_samples = len(out)
+    weights, gains = _brown_weights(sample_rate)
+    broadcast = (-1,) + (1,) * (out.ndim - 1)
+    weights = weights.reshape(broadcast)
+    gains = gains.reshape(broadcast)
+
+    # y[s + j] = leak^(j+1) * (y[s-1] + sum_{i<=j} step * leak^-(i+1) * x[s+i])
+    running = np.empty((BROWN_BLOCK + 1,) + out.shape[1:])
+    i = 0
+    while i < num_samples:
+        j = (start + i) % BROWN_BLOCK
+        k = min(num_samples - i, BROWN_BLOCK - j)
+        running[0] = total
+        np.multiply(steps[i:i + k], weights[j:j + k], out=running[1:k + 1])
+        np.cumsum(running[:k + 1], axis=0, out=running[:k + 1])
+        np.multiply(running[1:k + 1], gains[j:j + k], out=out[i:i + k])
+        total = running[k].copy()
+        if j + k == BROWN_BLOCK:
+            # Rebase onto the next sub-block: the sum becomes y itself
+            total *= gains[-1]
+        i += k
+    return total
+
+
+# Process pool shared by parallel renders, as (max_workers, pool).
+_segment_pool: Optional[Tuple[int, ProcessPoolExecutor]] = None
+_segment_pool_lock = threading.Lock()
+
+
+def _get_segment_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, with room for at least `workers`.
+
+    Worker processes start on first use and serve every later render; a
+    render asking for more workers replaces the pool with a larger one.
+    The pool is shut down when the interpreter exits.
+    """
+    global _segment_pool
+    with _segment_pool_lock:
+        if _segment_pool is None or _segment_pool[0] < workers:
+            if _segment_pool is None:
+                atexit.register(_shutdown_segment_pool)
+            else:
+                _segment_pool[1].shutdown(wait=False)
+            _segment_pool = (workers, ProcessPoolExecutor(max_workers=workers))
+        return _segment_pool[1]
+
+
+def _shutdown_segment_pool():
+    """
+    Shut down the shared process pool, if one was started.
+    """
+    global _segment_pool
+    with _segment_pool_lock:
+        if _segment_pool is not None:
+            _segment_pool[1].shutdown()
+            _segment_pool = None
+
+
+def _render_segment(job) -> np.ndarray:
+    """
+    Process-pool worker: render one segment from rest into shared memory.
+
+    Returns the filter state reached, which `render_parallel` combines
+    with the free response of the segment's true starting state.
+    """
+    (sample_rate, entropy, channels, correlation, velvet_density, spectral_curve,
+     noise_type, start, count, shm_name, shape, offset) = job
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frames = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        gen = AudioNoiseGenerator(sample_rate, entropy, channels, correlation)
+        gen.velvet_density = velvet_density
+        gen.spectral_curve = spectral_curve
+        gen.seek(start)
+        gen.fill(noise_type, frames[offset:offset + count])
+        return gen._filter_state(noise_type)
+    finally:
+        del frames
+        shm.close()
 
 
 class AudioNoiseGenerator:
     """
     Main audio noise generator class.
+
+    With ``channels > 1`` every method produces C-contiguous
+    ``(samples, channels)`` frames, ready for the audio device and the
+    exporter. Each channel has its own counter stream; `correlation`
+    blends in a shared stream so every pair of channels correlates by
+    that coefficient.
     """
 
     def __init__(
         self,
         sample_rate: int = 44100,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        channels: int = 1,
+        correlation: float = 0.0,
     ):
+        if channels < 1:
+            raise ValueError("channels must be at least 1.")
+        if not 0.0 <= correlation <= 1.0:
+            raise ValueError("correlation must be between 0 and 1.")
         self.sample_rate = sample_rate
+        self.channels = channels
+        self.correlation = correlation
+        self.velvet_density = DEFAULT_VELVET_DENSITY
+        self.spectral_curve = None
         self.seed = seed
         self.rng = create_numpy_rng(seed)
+        self._derive_keys()
+        self.position = 0
+        self._reset_filters()
 
     def generate_white_noise(
         self,
         duration_seconds: float,
-        amplitude: float = 1.0
+        amplitude: float = 1.0,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Generate white noise.
 
+        Samples come from a counter-based stream: each call continues at
+        `position`, and `seek` jumps anywhere in the stream without
+        generating the samples before it.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        amplitude : float
+            Peak amplitude
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output length to fill and return
+
+        Returns
+        -------
+        numpy.ndarray
+            Audio samples in range [-1, 1], shape (samples,) or
+            (samples, channels)
+        """
+        num_samples = int(self.sample_rate * duration_seconds)
+        out = prepare_output(self.frame_shape(num_samples), dtype, out)
+        self._white_samples(out)
+        if amplitude != 1.0:
+            out *= amplitude
+        return out
+
+    def seek(self, sample: int):
+        """
+        Move the stream position to sample index `sample`.
+
+        White noise resumes exactly where a continuous render would be.
+        Filtered noise types restart their filters from rest.
+        """
+        if sample < 0:
+            raise ValueError("sample must be non-negative.")
+        self.position = sample
+        self._reset_filters()
+
+    def frame_shape(self, num_samples: int) -> Tuple[int, ...]:
+        """
+        Shape of `num_samples` frames: 1D for mono, else (samples, channels).
+        """
+        if self.channels == 1:
+            return (num_samples,)
+        return (num_samples, self.channels)
+
+    def generate_pink_noise(
+        self,
+        duration_seconds: float,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Generate pink (1/f) noise.
+
+        White noise from the stream is shaped by a three-pole IIR filter
+        whose state carries over between calls, so consecutive calls
+        form one continuous signal: rendering in blocks gives exactly
+        the samples of a one-shot render, in constant memory.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output length to fill and return
+
         Returns
         -------
         numpy.ndarray
-            Audio samples in range [-1, 1]
+            Audio samples with peaks near [-1, 1], shape (samples,) or
+            (samples, channels)
         """
         num_samples = int(self.sample_rate * duration_seconds)
-        noise = self.rng.uniform(-1.0, 1.0, num_samples)
-        return noise * amplitude
+        return self._pink_samples(prepare_output(self.frame_shape(num_samples), dtype, out))
 
-    def generate_pink_noise(self, duration_seconds: float) -> np.ndarray:
+    def generate_brown_noise(
+        self,
+        duration_seconds: float,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
-        Placeholder for pink noise generation.
+        Generate brown (1/f^2) noise.
+
+        White noise from the stream drives a leaky integrator,
+        ``y[n] = leak * y[n-1] + step * x[n]``, whose leak rolls off
+        frequencies below `BROWN_DC_CUTOFF_HZ` so the signal cannot
+        drift. Inside each sub-block the recursion is unrolled into one
+        cumulative sum of leak-weighted steps; the running sum carries
+        over between calls, so rendering in blocks gives exactly the
+        samples of a one-shot render, in constant memory.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output length to fill and return
+
+        Returns
+        -------
+        numpy.ndarray
+            Audio samples with peaks near [-1, 1], shape (samples,) or
+            (samples, channels)
         """
-        raise NotImplementedError("Pink noise not implemented yet.")
+        num_samples = int(self.sample_rate * duration_seconds)
+        return self._brown_samples(prepare_output(self.frame_shape(num_samples), dtype, out))
 
-    def generate_brown_noise(self, duration_seconds: float) -> np.ndarray:
+    def generate_velvet_noise(
+        self,
+        duration_seconds: float,
+        density: Optional[float] = None,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
-        Placeholder for brown (Brownian) noise generation.
+        Generate velvet noise: sparse +/-1 impulses at a set density.
+
+        Each grid cell of ``sample_rate / density`` samples holds one
+        impulse at a seeded position with a seeded sign. Only the pulses
+        are computed, so rendering costs O(pulses) plus zeroing the
+        buffer. Velvet noise sounds smoother than white noise from about
+        2000 pulses per second. Channels are independent; `correlation`
+        does not apply.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        density : float or None
+            Pulses per second; defaults to `velvet_density`
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output length to fill and return
+
+        Returns
+        -------
+        numpy.ndarray
+            Samples of 0 and +/-1, shape (samples,) or (samples, channels)
+        """
+        num_samples = int(self.sample_rate * duration_seconds)
+        out = prepare_output(self.frame_shape(num_samples), dtype, out)
+        return self._velvet_samples(out, density)
+
+    def generate_velvet_pulses(
+        self,
+        duration_seconds: float,
+        density: Optional[float] = None,
+        channel: int = 0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the next velvet-noise clip in sparse form, e.g. for
+        convolution or reverb, and advance the stream.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        density : float or None
+            Pulses per second; defaults to `velvet_density`
+        channel : int
+            Channel whose pulses to return
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            ``(indices, signs)``: int64 sample offsets from the start of
+            the clip and int8 signs of +/-1; the same pulses
+            `generate_velvet_noise` would place
         """
-        raise NotImplementedError("Brown noise not implemented yet.")
+        num_samples = int(self.sample_rate * duration_seconds)
+        indices, signs = self._velvet_block(num_samples, self._velvet_period(density), np.int8)
+        # Drop the pulses parked at either end; see `_velvet_block`
+        kept = signs[channel] != 0
+        self.position += num_samples
+        return indices[channel][kept], signs[channel][kept]
+
+    def set_spectral_curve(
+        self,
+        frequencies: Optional[Sequence[float]],
+        magnitudes: Optional[Sequence[float]] = None,
+    ):
+        """
+        Set the magnitude curve used by shaped noise.
+
+        The curve is linearly interpolated between points and held flat
+        beyond the first and last; only its shape matters, as the output
+        level is fixed. Convert dB values with ``10 ** (db / 20)``.
+
+        Parameters
+        ----------
+        frequencies : sequence of float or None
+            Ascending frequencies in Hz; None restores a flat curve
+        magnitudes : sequence of float
+            Linear magnitude at each frequency
+        """
+        if frequencies is None:
+            self.spectral_curve = None
+            return
+        frequencies = tuple(float(f) for f in frequencies)
+        magnitudes = tuple(float(m) for m in magnitudes)
+        if not frequencies or len(frequencies) != len(magnitudes):
+            raise ValueError("frequencies and magnitudes must be non-empty and of equal length.")
+        if np.any(np.diff(frequencies) <= 0):
+            raise ValueError("frequencies must be strictly ascending.")
+        if min(magnitudes) < 0 or max(magnitudes) == 0:
+            raise ValueError("magnitudes must be non-negative and not all zero.")
+        self.spectral_curve = (frequencies, magnitudes)
+
+    def generate_shaped_noise(
+        self,
+        duration_seconds: float,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Generate noise shaped to `spectral_curve`.
+
+        White noise from the stream is convolved with a linear-phase FIR
+        kernel built from the curve (see `set_spectral_curve`), using
+        FFT frames of `SHAPED_FFT` samples. Frames overlap by the kernel
+        length and sit at fixed absolute positions, so each output
+        sample depends only on its index: blocks join exactly, `seek`
+        is exact, and memory stays constant for any duration. The kernel
+        spectrum is cached per curve.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output length to fill and return
+
+        Returns
+        -------
+        numpy.ndarray
+            Audio samples with peaks near [-1, 1], shape (samples,) or
+            (samples, channels)
+        """
+        num_samples = int(self.sample_rate * duration_seconds)
+        return self._shaped_samples(prepare_output(self.frame_shape(num_samples), dtype, out))
+
+    def stream(
+        self,
+        block_size: int = DEFAULT_STREAM_BLOCK,
+        noise_type: str = "white",
+        total_samples: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield float32 blocks of continuous noise.
+
+        Blocks continue the generator's stream from `position`, so they
+        join seamlessly and equal the matching slice of a one-shot
+        render. Only one block is in memory at a time, so renders of any
+        length (e.g. an 8-hour sleep track) run in constant memory.
+
+        Parameters
+        ----------
+        block_size : int
+            Samples per block
+        noise_type : str
+            One of AUDIO_NOISE_TYPES
+        total_samples : int or None
+            Stop after this many samples (the last block may be shorter);
+            None streams forever
+
+        Yields
+        ------
+        numpy.ndarray
+            float32 block of shape (samples,) or (samples, channels)
+        """
+        if noise_type not in AUDIO_NOISE_TYPES:
+            raise ValueError(f"Unknown noise type '{noise_type}'.")
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1.")
+        remaining = total_samples
+        while remaining is None or remaining > 0:
+            size = block_size if remaining is None else min(block_size, remaining)
+            yield self.fill(noise_type, np.empty(self.frame_shape(size), dtype=np.float32))
+            if remaining is not None:
+                remaining -= size
+
+    def fill(self, noise_type: str, out: np.ndarray) -> np.ndarray:
+        """
+        Fill `out` with the next ``len(out)`` samples of `noise_type`.
+
+        This is the sample-count counterpart of the ``generate_*``
+        methods, for callers that manage their own buffers.
+        """
+        if noise_type == "white":
+            return self._white_samples(out)
+        if noise_type == "pink":
+            return self._pink_samples(out)
+        if noise_type == "brown":
+            return self._brown_samples(out)
+        if noise_type == "velvet":
+            return self._velvet_samples(out)
+        if noise_type == "shaped":
+            return self._shaped_samples(out)
+        raise ValueError(f"Unknown noise type '{noise_type}'.")
+
+    def render_parallel(
+        self,
+        duration_seconds: float,
+        noise_type: str = "pink",
+        workers: int = 1,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Render a long clip with segments spread over a process pool.
+
+        The clip is cut into `PARALLEL_SEGMENT`-sample segments at fixed
+        absolute positions. Workers draw their white noise straight from
+        the counter streams and filter it from rest, writing into shared
+        memory. The parent then walks the segments in order, carrying the
+        filter state across each boundary and adding the free response of
+        that state, which is cheap because the filters decay quickly. The
+        result is identical for any worker count and matches a sequential
+        render to within rounding.
+
+        Worker processes are started on the first parallel render and
+        kept for later ones. Only whole segments (about 6 s at 44.1 kHz)
+        go to the pool, so shorter clips render in this process, and a
+        clip needs a few segments per worker before the pool pays off.
+
+        Like the other methods this continues from `position`, and the
+        generator's state afterwards is as if the clip had been rendered
+        sequentially.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        noise_type : str
+            One of AUDIO_NOISE_TYPES
+        workers : int
+            Number of worker processes; 1 renders in this process
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output shape to fill and return
+
+        Returns
+        -------
+        numpy.ndarray
+            Audio samples, shape (samples,) or (samples, channels)
+        """
+        if noise_type not in AUDIO_NOISE_TYPES:
+            raise ValueError(f"Unknown noise type '{noise_type}'.")
+        num_samples = int(self.sample_rate * duration_seconds)
+        out = prepare_output(self.frame_shape(num_samples), dtype, out)
+
+        # Unaligned head and tail run here, continuing the exact state
+        head = min(num_samples, -self.position % PARALLEL_SEGMENT)
+        body = (num_samples - head) // PARALLEL_SEGMENT
+        self.fill(noise_type, out[:head])
+        if body:
+            self._render_segments(noise_type, out[head:head + body * PARALLEL_SEGMENT], workers)
+        self.fill(noise_type, out[head + body * PARALLEL_SEGMENT:])
+        return out
+
+    def generate_batch(
+        self,
+        seeds: Sequence[Optional[int]],
+        duration_seconds: float,
+        noise_type: str = "white",
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Generate one clip per seed into one stacked array.
+
+        Row ``i`` equals what a fresh generator seeded with ``seeds[i]``
+        (and this generator's channel layout) produces. Every type is
+        rendered in one pass over the ``(seeds, samples)`` array: white
+        rows come from one counter stream per seed, pink is a single
+        `lfilter` along the sample axis, brown a single run of the
+        integrator kernel, velvet one scatter of all pulses and shaped
+        one FFT per frame for all seeds.
+
+        Parameters
+        ----------
+        seeds : sequence of int or None
+            One seed per output clip
+        duration_seconds : float
+            Length of each clip
+        noise_type : str
+            One of AUDIO_NOISE_TYPES
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output shape to fill and return
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (len(seeds), samples) or
+            (len(seeds), samples, channels)
+        """
+        if noise_type not in AUDIO_NOISE_TYPES:
+            raise ValueError(f"Unknown noise type '{noise_type}'.")
+        num_samples = int(self.sample_rate * duration_seconds)
+        out = prepare_output((len(seeds),) + self.frame_shape(num_samples), dtype, out)
+        if not out.size:
+            return out
+        entropies = [seed_entropy(seed) for seed in seeds]
+
+        if noise_type == "velvet":
+            return self._velvet_batch(entropies, out)
+        keys = self._batch_keys(entropies)
+        if noise_type == "shaped":
+            return self._shaped_batch(keys, out)
+        if noise_type == "pink" and lfilter is None:
+            raise ImportError("Pink noise requires scipy.")
+
+        # Work in sample blocks across all seeds so the temporaries stay
+        # in cache; streams and filter state carry over between blocks.
+        streams = self._batch_streams(keys, 0)
+        block = max(BROWN_BLOCK, BATCH_BLOCK_WORDS // (out.size // num_samples))
+        white = np.empty((len(out), min(block, num_samples)) + out.shape[2:])
+        pink_state = np.zeros((len(out), len(PINK_A) - 1) + out.shape[2:])
+        brown_sum = np.zeros(out.shape[:1] + out.shape[2:])
+        for lo in range(0, num_samples, block):
+            chunk = out[:, lo:lo + block]
+            if noise_type == "white":
+                self._white_batch(streams, chunk)
+                continue
+            steps = self._white_batch(streams, white[:, :chunk.shape[1]])
+            if noise_type == "pink":
+                pink, pink_state = lfilter(PINK_B, PINK_A, steps, axis=1, zi=pink_state)
+                np.multiply(pink, PINK_GAIN, out=chunk)
+            else:
+                # The kernel runs along axis 0, so view samples first
+                brown_sum = _leaky_integrate(
+                    np.moveaxis(steps, 1, 0), lo, brown_sum, self.sample_rate, np.moveaxis(chunk, 1, 0),
+                )
+        return out
 
     def reset_seed(self, seed: Optional[int]):
         """
-        Reset the RNG with a new seed.
+        Reset the RNG with a new seed and rewind the stream.
         """
         self.seed = seed
         self.rng = create_numpy_rng(seed)
+        self._derive_keys()
+        self.position = 0
+        self._reset_filters()
+
+    def _render_segments(self, noise_type: str, out: np.ndarray, workers: int):
+        """
+        Fill `out` (whole segments from an aligned position) in parallel.
+        """
+        segments = len(out) // PARALLEL_SEGMENT
+        wave = max(1, min(workers, segments))
+        shape = (wave * PARALLEL_SEGMENT,) + out.shape[1:]
+        shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        pool = _get_segment_pool(wave) if wave > 1 else None
+        try:
+            frames = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            state = self._filter_state(noise_type)
+            for first in range(0, segments, wave):
+                count = min(wave, segments - first)
+                jobs = [
+                    (self.sample_rate, self._entropy, self.channels, self.correlation,
+                     self.velvet_density, self.spectral_curve, noise_type,
+                     self.position + (first + i) * PARALLEL_SEGMENT,
+                     PARALLEL_SEGMENT, shm.name, shape, i * PARALLEL_SEGMENT)
+                    for i in range(count)
+                ]
+                rest_states = list(pool.map(_render_segment, jobs) if pool else map(_render_segment, jobs))
+                for i, rest_state in enumerate(rest_states):
+                    segment = frames[i * PARALLEL_SEGMENT:(i + 1) * PARALLEL_SEGMENT]
+                    if noise_type in _FILTERED_NOISE_TYPES:
+                        state = rest_state + self._add_free_response(noise_type, segment, state)
+                    out[(first + i) * PARALLEL_SEGMENT:(first + i + 1) * PARALLEL_SEGMENT] = segment
+            del frames
+        finally:
+            shm.close()
+            shm.unlink()
+
+        self.position += len(out)
+        if noise_type in _FILTERED_NOISE_TYPES:
+            self._set_filter_state(noise_type, state)
+
+    def _add_free_response(self, noise_type: str, segment: np.ndarray, state: np.ndarray) -> np.ndarray:
+        """
+        Add the free response of `state` to `segment`; return the state it
+        decays to by the end of the segment.
+        """
+        poles, to_residues, to_state, powers = _free_response_model(noise_type, self.sample_rate)
+        residues = to_residues @ state
+        length = min(len(segment), len(powers))
+        segment[:length] += powers[:length] @ residues
+        # Free outputs just past the segment, mapped back to a state
+        tail = poles[None, :] ** (len(segment) + np.arange(len(poles)))[:, None]
+        return to_state @ (tail @ residues)
+
+    def _filter_state(self, noise_type: str) -> np.ndarray:
+        """
+        Return a copy of the carried state of `noise_type` as a
+        ``(order,)`` or ``(order, channels)`` array.
+        """
+        if noise_type == "pink":
+            return self._pink_state.copy()
+        if noise_type == "brown":
+            return np.array(self._brown_sum)[None]
+        return np.zeros(0)
+
+    def _set_filter_state(self, noise_type: str, state: np.ndarray):
+        """
+        Restore a state returned by `_filter_state`.
+        """
+        if noise_type == "pink":
+            self._pink_state = state
+        elif noise_type == "brown":
+            self._brown_sum = state[0]
+
+    def _derive_keys(self):
+        """
+        Derive the counter-stream keys for the current seed.
+
+        Mono uses the seed's root stream. Channel ``c`` of a multichannel
+        layout uses stream ``c``, so adding channels leaves the existing
+        ones unchanged; the shared (correlated) component uses the next id.
+        """
+        entropy = seed_entropy(self.seed)
+        self._entropy = entropy
+        self._white_key = counter_key(entropy)
+        self._channel_keys = [counter_key(entropy, c) for c in range(self.channels)]
+        self._common_key = counter_key(entropy, self.channels)
+        self._velvet_keys = [
+            counter_key(entropy, _VELVET_STREAM, c) for c in range(self.channels)
+        ]
+        # Last shaped frame rendered, as (frame index, curve, samples)
+        self._shaped_frame = None
+        # Velvet stream continuation, as (next position, period, streams,
+        # words of the cell straddling that position); see `_velvet_block`
+        self._velvet_cursor = None
+
+    def _reset_filters(self):
+        """
+        Return the pink filter and brown integrator to rest.
+        """
+        channel_shape = self.frame_shape(0)[1:]
+        self._pink_state = np.zeros((len(PINK_A) - 1,) + channel_shape)
+        self._brown_sum = np.zeros(channel_shape)
+
+    def _white_samples(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fill `out` with the next uniform [-1, 1) samples and advance.
+        """
+        self._white_at(self.position, out)
+        self.position += len(out)
+        return out
+
+    def _white_at(self, start: int, out: np.ndarray) -> np.ndarray:
+        """
+        Fill `out` with uniform [-1, 1) samples from index `start`.
+        """
+        num_samples = len(out)
+        if out.ndim == 1:
+            counter_uniform(self._white_key, start, num_samples, out=out)
+        else:
+            for key, column in zip(self._channel_keys, out.T):
+                counter_uniform(key, start, num_samples, out=column)
+        out *= 2.0
+        out -= 1.0
+
+        if out.ndim == 2 and self.correlation > 0.0:
+            shared = counter_uniform(self._common_key, start, num_samples, dtype=out.dtype)
+            self._mix_shared(out, shared)
+        return out
+
+    def _mix_shared(self, out: np.ndarray, shared: np.ndarray):
+        """
+        Blend the uniform [0, 1) `shared` stream into the [-1, 1) channels
+        of `out` (channels on the last axis) to reach `correlation`.
+        """
+        # x_c = a * shared + b * own_c correlates channel pairs by
+        # a^2 / (a^2 + b^2) = correlation; dividing by a + b keeps
+        # samples inside [-1, 1].
+        shared_weight = np.sqrt(self.correlation)
+        own_weight = np.sqrt(1.0 - self.correlation)
+        norm = 1.0 / (shared_weight + own_weight)
+        shared *= 2.0 * shared_weight * norm
+        shared -= shared_weight * norm
+        out *= own_weight * norm
+        out += shared[..., None]
+
+    def _batch_keys(self, entropies: Sequence[int]):
+        """
+        Return the white-noise keys of several seeds, as `_derive_keys`
+        would: ``(own, shared)`` with `own` shaped (seeds,) or
+        (seeds, channels) and `shared` None for mono.
+        """
+        if self.channels == 1:
+            return [counter_key(e) for e in entropies], None
+        own = [[counter_key(e, c) for c in range(self.channels)] for e in entropies]
+        return own, [counter_key(e, self.channels) for e in entropies]
+
+    def _batch_streams(self, keys, start: int):
+        """
+        Open the streams of `_batch_keys` at sample `start`.
+        """
+        own, shared = keys
+        if shared is not None and self.correlation > 0.0:
+            return CounterStreams(own, start), CounterStreams(shared, start)
+        return CounterStreams(own, start), None
+
+    def _white_batch(self, streams, out: np.ndarray) -> np.ndarray:
+        """
+        Fill the stacked `out` with the next uniform [-1, 1) samples of
+        each seed's streams; see `_white_at`.
+        """
+        own, shared = streams
+        num_samples = out.shape[1]
+        # Streams are (seed, channel) rows; samples run along the last axis
+        own.uniform(num_samples, out=out if out.ndim == 2 else out.transpose(0, 2, 1))
+        out *= 2.0
+        out -= 1.0
+        if shared is not None:
+            self._mix_shared(out, shared.uniform(num_samples, dtype=out.dtype))
+        return out
+
+    def _velvet_batch(self, entropies: Sequence[int], out: np.ndarray) -> np.ndarray:
+        """
+        Fill the stacked `out` with each seed's velvet noise from sample 0.
+        """
+        period = self._velvet_period(None)
+        num_samples = out.shape[1]
+        cells = int(np.ceil(num_samples / period))
+        edges = np.floor(np.arange(cells + 1) * period).astype(np.int64)
+        keys = [counter_key(e, _VELVET_STREAM, c) for e in entropies for c in range(self.channels)]
+        indices, signs = _velvet_decode(counter_words_batch(keys, 0, cells), edges)
+
+        # Only the last cell can reach past the clip, and it alone covers
+        # the last sample, so its pulse is parked there with no sign
+        past = indices[:, -1] >= num_samples
+        indices[past, -1] = num_samples - 1
+        signs[past, -1] = 0
+
+        # Rows of `indices` are (seed, channel) streams
+        seed_index, channel = np.divmod(np.arange(len(keys))[:, None], self.channels)
+        out.fill(0.0)
+        frames = out if out.ndim == 3 else out[..., None]
+        frames[seed_index, indices, channel] = signs
+        return out
+
+    def _shaped_batch(self, keys, out: np.ndarray) -> np.ndarray:
+        """
+        Fill the stacked `out` with each seed's shaped noise from sample 0;
+        see `_shaped_hop`.
+        """
+        spectrum = _shaping_spectrum(self.sample_rate, self.spectral_curve)
+        if self.channels > 1:
+            spectrum = spectrum[:, None]
+        num_samples = out.shape[1]
+        white = np.empty((len(out),) + self.frame_shape(SHAPED_FFT))
+        for start in range(0, num_samples, SHAPED_HOP):
+            self._white_batch(self._batch_streams(keys, start), white)
+            shaped = np.fft.irfft(np.fft.rfft(white, axis=1) * spectrum, SHAPED_FFT, axis=1)
+            count = min(SHAPED_HOP, num_samples - start)
+            out[:, start:start + count] = shaped[:, SHAPED_TAPS - 1:SHAPED_TAPS - 1 + count]
+        return out
+
+    def _velvet_samples(self, out: np.ndarray, density: Optional[float] = None) -> np.ndarray:
+        """
+        Fill `out` with the next velvet samples and advance.
+        """
+        period = self._velvet_period(density)
+        out.fill(0.0)
+        columns = out[:, None] if out.ndim == 1 else out
+        for column, indices, signs in zip(columns.T, *self._velvet_block(len(out), period, out.dtype)):
+            column[indices] = signs
+        self.position += len(out)
+        return out
+
+    def _velvet_block(self, count: int, period: float, dtype) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the velvet pulses of every channel in the next `count` samples.
+
+        The result is ``(indices, signs)``, both shaped (channels, cells)
+        with one pulse per grid cell touching the block; indices are
+        relative to `position` and signs have `dtype`, so the scatter
+        into the output needs no cast. Only the first and last cell can
+        reach outside the block; such a pulse is parked on the block's
+        first or last sample, which its own cell covers, with sign 0.
+        Consecutive blocks continue one positioned counter stream per
+        channel and carry the word of a cell that straddles the block
+        end, so each grid cell is drawn once; the pulses equal
+        `velvet_pulses` over the same range.
+        """
+        if not count:
+            return np.empty((self.channels, 0), dtype=np.int64), np.empty((self.channels, 0), dtype=dtype)
+        start = self.position
+        end = start + count
+        first = _velvet_cell(start, period)
+        cursor = self._velvet_cursor
+        if cursor is not None and cursor[0] == start and cursor[1] == period:
+            streams, carried = cursor[2:]
+        else:
+            streams = CounterStreams(self._velvet_keys, first)
+            carried = np.empty((self.channels, 0), dtype=np.uint64)
+        last = _velvet_cell(end - 1, period)
+        words = streams.words(last + 1 - streams.position)
+        if carried.shape[1]:
+            words = np.concatenate((carried, words), axis=1)
+        edges = (np.arange(first, last + 2) * period).astype(np.int64)
+        edges -= start
+        indices, signs = _velvet_decode(words, edges, dtype)
+        for row, row_signs in zip(indices, signs[:, :1]):
+            if row[0] < 0:
+                row[0] = row_signs[0] = 0
+        for row, row_signs in zip(indices, signs[:, -1:]):
+            if row[-1] >= count:
+                row[-1] = count - 1
+                row_signs[0] = 0
+        self._velvet_cursor = (end, period, streams, words[:, _velvet_cell(end, period) - first:])
+        return indices, signs
+
+    def _velvet_period(self, density: Optional[float]) -> float:
+        """
+        Samples per velvet pulse for `density` (default `velvet_density`).
+        """
+        density = self.velvet_density if density is None else density
+        if not 0 < density <= self.sample_rate:
+            raise ValueError("density must be positive and at most the sample rate.")
+        return self.sample_rate / density
+
+    def _shaped_samples(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fill `out` with the next shaped samples and advance.
+        """
+        num_samples = len(out)
+        done = 0
+        while done < num_samples:
+            frame, offset = divmod(self.position + done, SHAPED_HOP)
+            count = min(num_samples - done, SHAPED_HOP - offset)
+            out[done:done + count] = self._shaped_hop(frame)[offset:offset + count]
+            done += count
+        self.position += num_samples
+        return out
+
+    def _shaped_hop(self, frame: int) -> np.ndarray:
+        """
+        Return the `SHAPED_HOP` output samples of shaping frame `frame`.
+
+        Overlap-save: output sample t is the kernel applied to white
+        samples ``t .. t + SHAPED_TAPS - 1``, so frame k reads white
+        samples from ``k * SHAPED_HOP`` and the first SHAPED_TAPS - 1
+        circular-convolution outputs are discarded. The last frame is
+        kept, so small blocks reuse it.
+        """
+        cached = self._shaped_frame
+        if cached is not None and cached[0] == frame and cached[1] == self.spectral_curve:
+            return cached[2]
+        spectrum = _shaping_spectrum(self.sample_rate, self.spectral_curve)
+        if self.channels > 1:
+            spectrum = spectrum[:, None]
+        white = self._white_at(frame * SHAPED_HOP, np.empty(self.frame_shape(SHAPED_FFT)))
+        shaped = np.fft.irfft(np.fft.rfft(white, axis=0) * spectrum, SHAPED_FFT, axis=0)
+        samples = shaped[SHAPED_TAPS - 1:]
+        self._shaped_frame = (frame, self.spectral_curve, samples)
+        return samples
+
+    def _pink_samples(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fill `out` with the next pink samples, carrying the filter state.
+        """
+        if lfilter is None:
+            raise ImportError("Pink noise requires scipy.")
+        if not len(out):
+            return out  # lfilter returns an uninitialised state for empty input
+        white = self._white_samples(np.empty(out.shape))
+        pink, self._pink_state = lfilter(PINK_B, PINK_A, white, axis=0, zi=self._pink_state)
+        np.multiply(pink, PINK_GAIN, out=out)
+        return out
+
+    def _brown_samples(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fill `out` with the next brown samples, carrying the integrator.
+        """
+        start = self.position
+        steps = self._white_samples(np.empty(out.shape))
+        self._brown_sum = _leaky_integrate(steps, start, self._brown_sum, self.sample_rate, out)
+        return out
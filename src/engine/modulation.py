@@ -0,0 +1,283 @@
+"""
+Audio modulation module.
+
+Time-varying processing on top of `AudioNoiseGenerator`:
+- Amplitude LFOs and envelopes
+- Low-pass filter cutoff sweeps
+
+Modulators are functions of the absolute sample index, so a modulated
+render gives the same samples however it is split into blocks.
+"""
+
+import numpy as np
+from typing import Iterator, Optional, Sequence, Union
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # scipy is optional; only filter sweeps need it
+    lfilter = None
+
+from .audio_noise import AUDIO_NOISE_TYPES, DEFAULT_STREAM_BLOCK, AudioNoiseGenerator
+from .noise_common import prepare_output
+
+
+# Samples per filter coefficient update. Sub-blocks are aligned to
+# absolute sample indices; about 5 ms at 48 kHz, far finer than the
+# slow sweeps ambient presets use.
+MODULATION_SUB_BLOCK = 256
+
+# Quality factor of the swept low-pass filter (Butterworth, no peak).
+DEFAULT_RESONANCE = 1.0 / np.sqrt(2.0)
+
+# Cutoffs are clamped into this range (Hz, and fraction of the sample rate).
+MIN_CUTOFF_HZ = 10.0
+MAX_CUTOFF_RATIO = 0.45
+
+LFO_SHAPES = ("sine", "triangle")
+
+
+class LFO:
+    """
+    Low-frequency oscillator sweeping between `low` and `high`.
+
+    Both shapes start halfway between the two values, rising.
+    """
+
+    def __init__(
+        self,
+        rate_hz: float,
+        low: float = 0.0,
+        high: float = 1.0,
+        shape: str = "sine",
+        phase: float = 0.0,
+    ):
+        if shape not in LFO_SHAPES:
+            raise ValueError(f"Unknown LFO shape '{shape}'.")
+        self.rate_hz = rate_hz
+        self.low = low
+        self.high = high
+        self.shape = shape
+        self.phase = phase
+
+    def at(self, indices: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Return the LFO value at each absolute sample index.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Sample indices
+        sample_rate : int
+            Samples per second
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        cycles = indices * (self.rate_hz / sample_rate) + self.phase
+        if self.shape == "sine":
+            wave = np.sin(2.0 * np.pi * cycles)
+            wave *= 0.5
+            wave += 0.5
+        else:
+            wave = np.mod(cycles + 0.25, 1.0)
+            wave -= 0.5
+            np.abs(wave, out=wave)
+            wave *= -2.0
+            wave += 1.0
+        wave *= self.high - self.low
+        wave += self.low
+        return wave
+
+
+class Envelope:
+    """
+    Piecewise-linear envelope through ``(time, value)`` breakpoints.
+
+    The first value holds before the first breakpoint and the last one
+    after the last.
+    """
+
+    def __init__(self, times: Sequence[float], values: Sequence[float]):
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if times.ndim != 1 or not len(times) or times.shape != values.shape:
+            raise ValueError("times and values must be non-empty and of equal length.")
+        if np.any(np.diff(times) < 0):
+            raise ValueError("times must be ascending.")
+        self.times = times
+        self.values = values
+
+    def at(self, indices: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Return the envelope value at each absolute sample index.
+        """
+        return np.interp(indices / sample_rate, self.times, self.values)
+
+
+Modulator = Union[float, LFO, Envelope]
+
+
+def modulator_values(modulator: Modulator, indices: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Evaluate a modulator, or a constant, at absolute sample indices.
+    """
+    if isinstance(modulator, (int, float)):
+        return np.full(len(indices), float(modulator))
+    return modulator.at(indices, sample_rate)
+
+
+def lowpass_coefficients(cutoff_hz: np.ndarray, q: float, sample_rate: int):
+    """
+    Return biquad low-pass coefficients for each cutoff, all at once.
+
+    Uses the RBJ audio-EQ-cookbook design, normalised so ``a[:, 0] == 1``.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(b, a)``, each of shape (len(cutoff_hz), 3)
+    """
+    cutoff_hz = np.clip(cutoff_hz, MIN_CUTOFF_HZ, MAX_CUTOFF_RATIO * sample_rate)
+    omega = 2.0 * np.pi * cutoff_hz / sample_rate
+    cos_w = np.cos(omega)
+    alpha = np.sin(omega) / (2.0 * q)
+    norm = 1.0 / (1.0 + alpha)
+    side = 0.5 * (1.0 - cos_w) * norm
+    b = np.column_stack([side, 2.0 * side, side])
+    a = np.column_stack([np.ones_like(norm), -2.0 * cos_w * norm, (1.0 - alpha) * norm])
+    return b, a
+
+
+class ModulatedNoise:
+    """
+    Noise from an `AudioNoiseGenerator` with modulated level and filter.
+
+    Each block is rendered by the generator in one call. The amplitude
+    modulator is then evaluated for every sample with array operations,
+    and the low-pass filter (when `cutoff` is set) runs one `lfilter`
+    call per `MODULATION_SUB_BLOCK` samples, with coefficients computed
+    for all sub-blocks of the block at once and the filter state
+    carried across. Python work therefore scales with sub-blocks, not
+    samples.
+    """
+
+    def __init__(
+        self,
+        generator: AudioNoiseGenerator,
+        noise_type: str = "white",
+        amplitude: Modulator = 1.0,
+        cutoff: Optional[Modulator] = None,
+        resonance: float = DEFAULT_RESONANCE,
+    ):
+        if noise_type not in AUDIO_NOISE_TYPES:
+            raise ValueError(f"Unknown noise type '{noise_type}'.")
+        if resonance <= 0:
+            raise ValueError("resonance must be positive.")
+        self.generator = generator
+        self.noise_type = noise_type
+        self.amplitude = amplitude
+        self.cutoff = cutoff
+        self.resonance = resonance
+        self._filter_state = None
+        # Generator position the filter state belongs to
+        self._state_position = None
+
+    def generate(
+        self,
+        duration_seconds: float,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Generate the next `duration_seconds` of modulated noise.
+
+        Parameters
+        ----------
+        duration_seconds : float
+            Length of the clip
+        dtype : numpy dtype
+            Output sample type, e.g. numpy.float32
+        out : numpy.ndarray or None
+            Preallocated array of the output length to fill and return
+
+        Returns
+        -------
+        numpy.ndarray
+            Audio samples, shape (samples,) or (samples, channels)
+        """
+        gen = self.generator
+        num_samples = int(gen.sample_rate * duration_seconds)
+        return self.fill(prepare_output(gen.frame_shape(num_samples), dtype, out))
+
+    def stream(
+        self,
+        block_size: int = DEFAULT_STREAM_BLOCK,
+        total_samples: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield float32 blocks of modulated noise, as
+        `AudioNoiseGenerator.stream` does for plain noise.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1.")
+        remaining = total_samples
+        while remaining is None or remaining > 0:
+            size = block_size if remaining is None else min(block_size, remaining)
+            yield self.fill(np.empty(self.generator.frame_shape(size), dtype=np.float32))
+            if remaining is not None:
+                remaining -= size
+
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fill `out` with the next ``len(out)`` modulated samples.
+        """
+        gen = self.generator
+        start = gen.position
+        gen.fill(self.noise_type, out)
+        if self.cutoff is not None:
+            self._sweep_filter(out, start)
+
+        if not (isinstance(self.amplitude, (int, float)) and self.amplitude == 1.0):
+            indices = np.arange(start, start + len(out))
+            gains = modulator_values(self.amplitude, indices, gen.sample_rate)
+            out *= gains if out.ndim == 1 else gains[:, None]
+        return out
+
+    def reset(self):
+        """
+        Return the filter to rest.
+        """
+        self._filter_state = None
+        self._state_position = None
+
+    def _sweep_filter(self, out: np.ndarray, start: int):
+        """
+        Low-pass `out` (samples from `start`) in place, updating the
+        coefficients at every aligned sub-block.
+        """
+        if lfilter is None:
+            raise ImportError("Filter sweeps require scipy.")
+        if not len(out):
+            return
+        gen = self.generator
+        if self._state_position != start:
+            # First block, or the generator was seeked: start from rest
+            self._filter_state = np.zeros((2,) + out.shape[1:])
+
+        first = start // MODULATION_SUB_BLOCK
+        last = (start + len(out) - 1) // MODULATION_SUB_BLOCK
+        edges = np.arange(first, last + 2) * MODULATION_SUB_BLOCK
+        # Coefficients come from the aligned sub-block starts, so a block
+        # boundary inside a sub-block does not change them
+        cutoffs = modulator_values(self.cutoff, edges[:-1], gen.sample_rate)
+        edges[0] = start
+        edges[-1] = start + len(out)
+        b, a = lowpass_coefficients(cutoffs, self.resonance, gen.sample_rate)
+
+        state = self._filter_state
+        for k in range(len(cutoffs)):
+            lo, hi = edges[k] - start, edges[k + 1] - start
+            out[lo:hi], state = lfilter(b[k], a[k], out[lo:hi], axis=0, zi=state)
+        self._filter_state = state
+        self._state_position = start + len(out)
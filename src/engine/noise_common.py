@@ -9,7 +9,7 @@ Shared logic such as:
 
 import random
 import numpy as np
-from typing import Optional
+from typing import Optional, Sequence
 
 
 def create_rng(seed: Optional[int] = None):
@@ -43,6 +43,254 @@ def create_numpy_rng(seed: Optional[int] = None):
     return np.random.default_rng(seed)
 
 
+def seed_entropy(seed: Optional[int] = None) -> int:
+    """
+    Return the entropy behind `seed`.
+
+    A None seed draws fresh entropy, so the value can be stored and used
+    to derive matching counter-RNG keys later.
+    """
+    return np.random.SeedSequence(seed).entropy
+
+
+# Values converted per pass when a stream fills a buffer other than a
+# contiguous float64 one; bounds the float64 scratch chunk.
+_COUNTER_CHUNK = 1 << 13
+
+
+def counter_key(entropy: int, *stream: int) -> int:
+    """
+    Derive the 128-bit counter-RNG key for a stream.
+
+    Parameters
+    ----------
+    entropy : int
+        Value from `seed_entropy`
+    *stream : int
+        Optional stream identifier, e.g. a channel index
+
+    Returns
+    -------
+    int
+    """
+    words = np.random.SeedSequence(entropy, spawn_key=stream).generate_state(2, np.uint64)
+    return int(words[0]) | (int(words[1]) << 64)
+
+
+def counter_uniform(
+    key: int,
+    start: int,
+    count: int,
+    dtype=np.float64,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Return uniform [0, 1) values `start` .. `start + count` of a keyed stream.
+
+    The stream is PCG64 seeded with `key`, which jumps ahead to `start`
+    in O(log start) steps, so any index range is produced directly,
+    without generating what comes before it. The result is identical,
+    bit for bit, to the matching slice of a longer range. Value ``i``
+    keeps the top bits of 64-bit word ``i`` that the float type holds,
+    so float32 values are float64 values truncated.
+
+    Parameters
+    ----------
+    key : int
+        Stream key from `counter_key`
+    start : int
+        Index of the first value
+    count : int
+        Number of values
+    dtype : numpy dtype
+        Output float type
+    out : numpy.ndarray or None
+        Preallocated 1D buffer to fill and return
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    out = prepare_output((count,), dtype, out)
+    _fill_uniform(_stream_at(key, start), out)
+    return out
+
+
+def counter_words(key: int, start: int, count: int) -> np.ndarray:
+    """
+    Return raw 64-bit words ``start .. start + count`` of a keyed stream.
+
+    These are the words `counter_uniform` turns into floats, for callers
+    that need integers or several fields per draw.
+    """
+    return _stream_at(key, start).bit_generator.random_raw(count)
+
+
+class CounterStreams:
+    """
+    Several keyed counter streams read in lockstep.
+
+    `keys` is a nested sequence of stream keys of any shape. Each
+    `uniform` call returns the next values of every stream, shaped
+    ``keys_shape + (count,)``; row ``[i, ...]`` equals the matching
+    `counter_uniform` range of ``keys[i, ...]`` bit for bit. The
+    generators are positioned once and kept, so a batch read in blocks
+    pays the setup cost once per stream rather than once per block.
+    NumPy generators take one seed each, so each stream is drawn in its
+    own call.
+    """
+
+    def __init__(self, keys, start: int = 0):
+        keys = np.asarray(keys, dtype=object)
+        self.shape = keys.shape
+        self.position = start
+        self._streams = [_stream_at(int(key), start) for key in keys.flat]
+
+    def uniform(
+        self,
+        count: int,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Return the next `count` uniform [0, 1) values of every stream.
+
+        Parameters
+        ----------
+        count : int
+            Number of values per stream
+        dtype : numpy dtype
+            Output float type
+        out : numpy.ndarray or None
+            Preallocated buffer to fill and return; it may be strided
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        out = prepare_output(self.shape + (count,), dtype, out)
+        for index, stream in zip(np.ndindex(*self.shape), self._streams):
+            _fill_uniform(stream, out[index])
+        self.position += count
+        return out
+
+    def words(self, count: int) -> np.ndarray:
+        """
+        Return the next `count` raw 64-bit words of every stream, the
+        `counter_words` counterpart of `uniform`.
+        """
+        out = np.empty((len(self._streams), count), dtype=np.uint64)
+        for row, stream in zip(out, self._streams):
+            row[:] = stream.bit_generator.random_raw(count)
+        self.position += count
+        return out.reshape(self.shape + (count,))
+
+
+def counter_words_batch(keys: Sequence[int], start: int, count: int) -> np.ndarray:
+    """
+    Return `counter_words` of several keyed streams as a (len(keys), count) array.
+    """
+    words = np.empty((len(keys), count), dtype=np.uint64)
+    for row, key in zip(words, keys):
+        row[:] = counter_words(key, start, count)
+    return words
+
+
+def _stream_at(key: int, start: int) -> np.random.Generator:
+    """
+    Return a generator positioned at word `start` of `key`'s stream.
+    """
+    bitgen = np.random.PCG64(key)
+    bitgen.advance(start)
+    return np.random.Generator(bitgen)
+
+
+def _fill_uniform(stream: np.random.Generator, out: np.ndarray):
+    """
+    Fill the 1D `out` with the next uniform values of `stream`.
+
+    `Generator.random` turns each word into a float64 from its top 53
+    bits. Contiguous float64 output is filled directly; other output
+    goes through a float64 scratch chunk, truncated to the bits the
+    float type holds so 1.0 never appears.
+    """
+    if out.dtype == np.float64 and out.flags.c_contiguous:
+        stream.random(out=out)
+        return
+    bits = min(np.finfo(out.dtype).nmant + 1, 53)
+    count = len(out)
+    scratch = np.empty(min(count, _COUNTER_CHUNK))
+    for lo in range(0, count, _COUNTER_CHUNK):
+        hi = min(count, lo + _COUNTER_CHUNK)
+        chunk = stream.random(out=scratch[:hi - lo])
+        if bits < 53:
+            chunk *= 2.0 ** bits
+            np.floor(chunk, out=chunk)
+            np.multiply(chunk, 2.0 ** -bits, out=out[lo:hi], casting="same_kind")
+        else:
+            np.copyto(out[lo:hi], chunk, casting="same_kind")
+
+
+def counter_uniform_2d(
+    key: int,
+    row_length: int,
+    x: int,
+    y: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Fill `out` with a window of a row-major 2D counter stream.
+
+    Pixel (x + c, y + r) takes stream index (y + r) * row_length + x + c,
+    so any window equals the matching slice of the full canvas.
+
+    `key` may also be a sequence of keys with `out` of shape
+    (len(key), rows, cols), one window per stream; see `CounterStreams`.
+    """
+    if out.ndim == 3:
+        height, width = out.shape[1:]
+        if x == 0 and width == row_length and out.flags.c_contiguous:
+            CounterStreams(key, y * row_length).uniform(height * width, out=out.reshape(len(out), -1))
+            return out
+        for r in range(height):
+            CounterStreams(key, (y + r) * row_length + x).uniform(width, out=out[:, r])
+        return out
+    height, width = out.shape
+    if x == 0 and width == row_length and out.flags.c_contiguous:
+        counter_uniform(key, y * row_length, height * width, out=out.reshape(-1))
+        return out
+    for r in range(height):
+        counter_uniform(key, (y + r) * row_length + x, width, out=out[r])
+    return out
+
+
+def prepare_output(shape, dtype=np.float64, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Return a buffer for generator output.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Required output shape
+    dtype : numpy dtype
+        Sample type used when `out` is None
+    out : numpy.ndarray or None
+        Caller-provided buffer; checked and returned as is
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    shape = tuple(shape)
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}.")
+    if not np.issubdtype(out.dtype, np.floating):
+        raise TypeError("out must have a floating-point dtype.")
+    return out
+
+
 def clamp(value: float, minimum: float, maximum: float) -> float:
     """
     Clamp a value between a minimum and maximum.
@@ -50,14 +298,23 @@ def clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(value, maximum))
 
 
-def normalize_array(arr: np.ndarray) -> np.ndarray:
+def normalize_array(arr: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Normalize a NumPy array to the range [0, 1].
+
+    If `out` is given (it may be `arr` itself) the result is written there.
     """
     min_val = arr.min()
     max_val = arr.max()
 
-    if max_val == min_val:
-        return np.zeros_like(arr)
+    if out is None:
+        if max_val == min_val:
+            return np.zeros_like(arr)
+        return (arr - min_val) / (max_val - min_val)
 
-    return (arr - min_val) / (max_val - min_val)
+    if max_val == min_val:
+        out.fill(0.0)
+        return out
+    np.subtract(arr, min_val, out=out)
+    out *= 1.0 / (max_val - min_val)
+    return out
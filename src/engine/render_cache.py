@@ -0,0 +1,275 @@
+"""
+Render cache module.
+
+Content-addressed storage for rendered noise, so rendering the same
+seeded parameters twice costs a lookup instead of a full computation.
+
+Keys hash a canonical description of the render: generator, noise
+type, parameters, seed and dtype. Results live in an in-memory LRU tier
+bounded by bytes and, optionally, an on-disk tier of ``.npy`` files.
+Unseeded renders are random by definition and never get a key.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+
+# Bump when generator output changes, so stale disk entries stop matching.
+RENDER_CACHE_VERSION = 3
+
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+DEFAULT_DISK_BYTES = 2 * 1024 * 1024 * 1024
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Convert parameter values to a JSON form where equal values match.
+
+    Numbers become floats (so 4 and 4.0 agree), tuples and arrays become
+    lists and mapping keys become strings.
+    """
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    elif isinstance(value, np.generic):
+        value = value.item()
+
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    raise TypeError(f"Cannot use {type(value).__name__} in a render cache key.")
+
+
+def render_key(
+    generator: str,
+    noise_type: str,
+    params: Dict[str, Any],
+    seed: Optional[int],
+    dtype=np.float64,
+) -> Optional[str]:
+    """
+    Return the cache key of a render, or None if `seed` is None.
+
+    Parameters
+    ----------
+    generator : str
+        Generator name, e.g. "image" or "audio"
+    noise_type : str
+        Noise type rendered
+    params : dict
+        Every other input that affects the output (size, sample rate,
+        noise parameters, ...)
+    seed : int or None
+        Render seed
+    dtype : numpy dtype
+        Output sample type
+
+    Returns
+    -------
+    str or None
+        Hex SHA-256 digest
+    """
+    if seed is None:
+        return None
+    payload = {
+        "version": RENDER_CACHE_VERSION,
+        "generator": generator,
+        "noise_type": noise_type,
+        "params": _canonical(params),
+        "seed": int(seed),
+        "dtype": np.dtype(dtype).str,
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    Two-tier cache of rendered arrays by `render_key`.
+
+    Cached arrays are read-only; copy before modifying. Arrays larger
+    than the memory budget skip the memory tier. The disk tier, when a
+    directory is given, evicts least recently used files beyond
+    `max_disk_bytes`.
+
+    Disk writes run in the calling thread unless `submit` is given, e.g.
+    ``get_export_queue().submit``: writes then go to that queue without
+    waiting, coalesced per key, and a write the full queue refuses is
+    skipped (the array stays in the memory tier).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MEMORY_BYTES,
+        directory: Optional[Path] = None,
+        max_disk_bytes: int = DEFAULT_DISK_BYTES,
+        submit: Optional[Callable[..., bool]] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.submit = submit
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: Optional[str]) -> Optional[np.ndarray]:
+        """
+        Return the cached array for `key`, or None.
+        """
+        if key is None:
+            return None
+        with self._lock:
+            array = self._memory.get(key)
+            if array is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return array
+
+        path = self._path(key)
+        if path is not None:
+            try:
+                array = np.load(path)
+                os.utime(path)
+            except (OSError, ValueError):
+                array = None
+            if array is not None:
+                array.flags.writeable = False
+                with self._lock:
+                    self._remember(key, array)
+                    self.hits += 1
+                return array
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: Optional[str], array: np.ndarray):
+        """
+        Store a copy of `array` under `key`; a None key is ignored.
+        """
+        if key is None:
+            return
+        array = np.array(array, copy=True)
+        array.flags.writeable = False
+        with self._lock:
+            self._remember(key, array)
+        if self.directory is None:
+            return
+        if self.submit is None:
+            self._store(key, array)
+        else:
+            self.submit(self._store, key, array, key=("render_cache", key), block=False)
+
+    def get_or_render(self, key: Optional[str], render: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Return the cached array for `key`, rendering and storing it on a miss.
+        """
+        array = self.get(key)
+        if array is None:
+            array = render()
+            self.put(key, array)
+        return array
+
+    def clear(self):
+        """
+        Drop the memory tier (disk files are kept).
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / f"{key}.npy"
+
+    def _remember(self, key: str, array: np.ndarray):
+        """
+        Add to the memory tier, evicting least recently used entries.
+        Call with the lock held.
+        """
+        if array.nbytes > self.max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+        self._memory[key] = array
+        self._memory_bytes += array.nbytes
+        while self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def _store(self, key: str, array: np.ndarray):
+        """
+        Write `array` to the disk tier atomically, then trim the tier.
+        """
+        path = self._path(key)
+        temp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(temp, "wb") as f:
+                np.save(f, array)
+            os.replace(temp, path)
+        except OSError:
+            temp.unlink(missing_ok=True)
+            return
+
+        entries = []
+        for entry in self.directory.glob("*.npy"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_disk_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+_default_cache: Optional[RenderCache] = None
+_default_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """
+    Return the shared render cache (memory only until configured).
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = RenderCache()
+        return _default_cache
+
+
+def configure_render_cache(
+    directory: Optional[Path] = None,
+    max_bytes: int = DEFAULT_MEMORY_BYTES,
+    max_disk_bytes: int = DEFAULT_DISK_BYTES,
+    submit: Optional[Callable[..., bool]] = None,
+) -> RenderCache:
+    """
+    Replace the shared render cache, e.g. to add a disk tier written
+    through a background queue.
+    """
+    global _default_cache
+    with _default_lock:
+        _default_cache = RenderCache(max_bytes, directory, max_disk_bytes, submit)
+        return _default_cache
@@ -0,0 +1,161 @@
+"""
+Background export queue.
+
+Runs encode-and-write jobs (autosaves, exports) on a worker thread so
+generation callbacks return as soon as the data is produced.
+"""
+
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+
+# Jobs waiting to run before `submit` applies backpressure.
+DEFAULT_MAX_PENDING = 4
+
+
+class ExportQueue:
+    """
+    Bounded queue of export jobs served by one worker thread.
+
+    Jobs submitted with the same `key` coalesce: a job still waiting is
+    replaced by the newer one, so a burst of live-preview autosaves
+    writes only the latest. When `max_pending` jobs are waiting, `submit`
+    blocks (or, non-blocking, refuses the job) until the worker catches
+    up, which bounds the memory held by queued data.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        self.max_pending = max_pending
+        self.dropped = 0  # jobs superseded before they ran
+        self._jobs = OrderedDict()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(
+        self,
+        func: Callable,
+        *args,
+        key: Optional[Hashable] = None,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Queue ``func(*args)``; return whether it was accepted.
+
+        Parameters
+        ----------
+        func : callable
+            Job to run on the worker thread; it must own its arguments
+            (pass copies of buffers that will be reused)
+        key : hashable or None
+            Coalescing key; a waiting job with the same key is dropped
+        block : bool
+            Wait for space when the queue is full
+        timeout : float or None
+            Longest wait for space, in seconds
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Export queue is closed.")
+            if key is None:
+                key = object()
+            if key not in self._jobs:
+                has_space = self._cond.wait_for(
+                    lambda: len(self._jobs) < self.max_pending or key in self._jobs or self._closed,
+                    timeout if block else 0,
+                )
+                if not has_space or self._closed:
+                    return False
+            if key in self._jobs:
+                # Keep the queue position so repeated updates are not starved
+                self.dropped += 1
+            self._jobs[key] = (func, args)
+            self._ensure_worker()
+            self._cond.notify_all()
+            return True
+
+    def pending(self) -> int:
+        """
+        Return the number of jobs waiting or running.
+        """
+        with self._cond:
+            return len(self._jobs) + self._busy
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued job has run; return False on timeout.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._jobs and not self._busy, timeout)
+
+    def close(self):
+        """
+        Run the remaining jobs, then stop the worker.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+
+    def _ensure_worker(self):
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="export-queue", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """
+        Worker thread: run jobs in order until closed and drained.
+        """
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._jobs or self._closed)
+                if not self._jobs:
+                    return
+                _, (func, args) = self._jobs.popitem(last=False)
+                self._busy = True
+                self._cond.notify_all()
+            try:
+                func(*args)
+            except Exception:
+                logging.exception("Background export failed")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+_default_queue: Optional[ExportQueue] = None
+_default_lock = threading.Lock()
+
+
+def get_export_queue() -> ExportQueue:
+    """
+    Return the shared export queue, creating it on first use.
+
+    The queue is closed, running everything still queued, when the
+    interpreter exits.
+    """
+    global _default_queue
+    with _default_lock:
+        if _default_queue is None:
+            _default_queue = ExportQueue()
+            atexit.register(_default_queue.close)
+        return _default_queue
+
+
+def flush_exports(timeout: Optional[float] = None) -> bool:
+    """
+    Wait for the shared queue's jobs to finish; return False on timeout.
+    """
+    with _default_lock:
+        queue = _default_queue
+    return True if queue is None else queue.flush(timeout)
@@ -5,20 +5,454 @@ Handles exporting generated noise to disk with
 advanced format and quality options.
 """
 
+import itertools
+import struct
+import zlib
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
 
 import numpy as np
 
+from engine.render_cache import RenderCache, get_render_cache
+
+
+# Rows per strip, and edge length of tiles, in streamed image exports.
+EXPORT_BLOCK_ROWS = 256
+
+# Frames per block when exporting an in-memory clip.
+EXPORT_AUDIO_BLOCK = 1 << 16
+
+# Default zlib level for PNG.
+DEFAULT_PNG_COMPRESSION = 6
+
+# Above this many bytes of pixel data, TIFF files are written as BigTIFF
+# (leaving headroom for deflate expansion and the IFD).
+_TIFF_CLASSIC_LIMIT = 2 ** 32 - 2 ** 25
+
+_PNG_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+
+# TIFF field types: SHORT, LONG, LONG8
+_TIFF_FIELD_DTYPES = {3: "<u2", 4: "<u4", 16: "<u8"}
+
+# WAV format tags, and the GUID tail shared by WAVE_FORMAT_EXTENSIBLE subformats.
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_IEEE_FLOAT = 3
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+_WAVE_GUID_TAIL = b"\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+
+# Largest RIFF size field; bigger files are rewritten as RF64.
+_RIFF_LIMIT = 0xFFFFFFFF
+
+# 32-bit size (and fact sample count) of an RF64 file; the real values
+# are in the ds64 chunk.
+_RF64_PLACEHOLDER = 0xFFFFFFFF
+
+
+def iter_tile_bands(
+    tiles: Iterable[Tuple[int, int, np.ndarray]],
+    width: int,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Assemble row-major ``(x, y, tile)`` tiles into full-width bands.
+
+    Only one band (one row of tiles) is held at a time.
+
+    Yields
+    ------
+    tuple
+        ``(y, band)`` where ``band`` has shape (tile_rows, width, ...)
+    """
+    band = None
+    band_y = 0
+    filled = 0
+    next_y = 0
+
+    for x, y, tile in tiles:
+        if band is None or y != band_y:
+            if band is not None:
+                if filled != width:
+                    raise ValueError(f"Tile row at y={band_y} does not cover the full width.")
+                yield band_y, band
+                next_y = band_y + band.shape[0]
+            if y != next_y:
+                raise ValueError("Tiles must arrive in row-major order.")
+            band = np.empty((tile.shape[0], width) + tile.shape[2:], dtype=tile.dtype)
+            band_y = y
+            filled = 0
+        if x != filled or tile.shape[0] != band.shape[0]:
+            raise ValueError("Tiles must arrive in row-major order.")
+        band[:, x:x + tile.shape[1]] = tile
+        filled += tile.shape[1]
+
+    if band is not None:
+        if filled != width:
+            raise ValueError(f"Tile row at y={band_y} does not cover the full width.")
+        yield band_y, band
+
+
+def iter_row_blocks(
+    bands: Iterable[Tuple[int, np.ndarray]],
+    rows: int,
+    height: int,
+) -> Iterator[np.ndarray]:
+    """
+    Regroup ``(y, band)`` bands of any height into blocks of `rows` rows.
+
+    Every block but the last has exactly `rows` rows; only one block is
+    held at a time.
+    """
+    block = None
+    filled = 0
+    total = 0
+    for y, band in bands:
+        if y != total:
+            raise ValueError("Bands must arrive in order from the top.")
+        total += len(band)
+        if total > height:
+            raise ValueError("Tiles extend past the image height.")
+        start = 0
+        while start < len(band):
+            if block is None:
+                block = np.empty((min(rows, height - y - start),) + band.shape[1:], dtype=band.dtype)
+                filled = 0
+            count = min(len(block) - filled, len(band) - start)
+            block[filled:filled + count] = band[start:start + count]
+            filled += count
+            start += count
+            if filled == len(block):
+                yield block
+                block = None
+    if total != height:
+        raise ValueError(f"Expected {height} rows of tiles, got {total}.")
+
+
+def _encode_samples(block: np.ndarray, bit_depth: int, byte_order: str) -> np.ndarray:
+    """
+    Convert [0, 1] float pixels to stored samples of `bit_depth` bits.
+    """
+    if bit_depth == 32:
+        return np.asarray(block, dtype=byte_order + "f4")
+    dtype = np.dtype(byte_order + ("u1" if bit_depth == 8 else "u2"))
+    samples = np.empty(block.shape, dtype=dtype)
+    np.multiply(np.clip(block, 0.0, 1.0), float(2 ** bit_depth - 1), out=samples, casting="unsafe")
+    return samples
+
+
+def _png_chunk(f: BinaryIO, kind: bytes, data: bytes):
+    f.write(struct.pack(">I", len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+
+def _write_png(
+    f: BinaryIO,
+    blocks: Iterable[np.ndarray],
+    width: int,
+    height: int,
+    channels: int,
+    bit_depth: int,
+    color_space: str,
+    level: int,
+):
+    """
+    Write a PNG from row blocks, compressing each into its own IDAT chunk.
+    """
+    f.write(b"\x89PNG\r\n\x1a\n")
+    header = struct.pack(">IIBBBBB", width, height, bit_depth, _PNG_COLOR_TYPES[channels], 0, 0, 0)
+    _png_chunk(f, b"IHDR", header)
+    if color_space == "sRGB":
+        _png_chunk(f, b"sRGB", b"\x00")
+    else:
+        _png_chunk(f, b"gAMA", struct.pack(">I", 100000))
+
+    compressor = zlib.compressobj(level)
+    for block in blocks:
+        samples = _encode_samples(block, bit_depth, ">")
+        # Each row starts with its filter type byte, 0 (none)
+        rows = np.zeros((len(block), 1 + samples[0].nbytes), dtype=np.uint8)
+        rows[:, 1:] = samples.reshape(len(block), -1).view(np.uint8)
+        data = compressor.compress(rows)
+        if data:
+            _png_chunk(f, b"IDAT", data)
+    _png_chunk(f, b"IDAT", compressor.flush())
+    _png_chunk(f, b"IEND", b"")
+
+
+def _write_tiff(
+    f: BinaryIO,
+    blocks: Iterable[np.ndarray],
+    width: int,
+    height: int,
+    channels: int,
+    bit_depth: int,
+    level: Optional[int],
+    tiled: bool,
+):
+    """
+    Write a striped or tiled TIFF from `EXPORT_BLOCK_ROWS`-row blocks.
+
+    Pixel data is written first and the IFD last, so segment offsets are
+    known when it is written; the header's IFD pointer is patched at the
+    end. Files too big for 32-bit offsets are written as BigTIFF.
+    """
+    size = EXPORT_BLOCK_ROWS
+    big = width * height * channels * (bit_depth // 8) > _TIFF_CLASSIC_LIMIT
+    if big:
+        f.write(b"II+\x00" + struct.pack("<HHQ", 8, 0, 0))
+    else:
+        f.write(b"II*\x00" + struct.pack("<I", 0))
+
+    offsets = []
+    counts = []
+
+    def write_segment(samples: np.ndarray):
+        data = samples.tobytes()
+        if level is not None:
+            data = zlib.compress(data, level)
+        offsets.append(f.tell())
+        counts.append(len(data))
+        f.write(data)
+
+    for block in blocks:
+        samples = _encode_samples(block, bit_depth, "<")
+        if not tiled:
+            write_segment(samples)
+            continue
+        # Edge tiles are padded to the full tile size
+        tile = np.zeros((size, size) + samples.shape[2:], dtype=samples.dtype)
+        for x in range(0, width, size):
+            piece = samples[:, x:x + size]
+            tile[:len(piece), :piece.shape[1]] = piece
+            if len(piece) < size or piece.shape[1] < size:
+                tile[len(piece):] = 0
+                tile[:, piece.shape[1]:] = 0
+            write_segment(tile)
+
+    offset_type = 16 if big else 4
+    entries = [
+        (256, 4, [width]),
+        (257, 4, [height]),
+        (258, 3, [bit_depth] * channels),
+        (259, 3, [1 if level is None else 8]),
+        (262, 3, [1 if channels < 3 else 2]),
+        (277, 3, [channels]),
+        (284, 3, [1]),
+        (339, 3, [3 if bit_depth == 32 else 1] * channels),
+    ]
+    if channels in (2, 4):
+        entries.append((338, 3, [2]))  # unassociated alpha
+    if tiled:
+        entries += [(322, 4, [size]), (323, 4, [size]), (324, offset_type, offsets), (325, offset_type, counts)]
+    else:
+        entries += [(278, 4, [size]), (273, offset_type, offsets), (279, offset_type, counts)]
+
+    ifd_offset = _write_tiff_ifd(f, sorted(entries), big)
+    f.seek(8 if big else 4)
+    f.write(struct.pack("<Q" if big else "<I", ifd_offset))
+
+
+def _write_tiff_ifd(f: BinaryIO, entries, big: bool) -> int:
+    """
+    Write `entries` as an IFD at the end of `f`; return its offset.
+
+    Values that do not fit inside their entry are written just before
+    the IFD.
+    """
+    inline = 8 if big else 4
+    fields = []
+    for tag, field_type, values in entries:
+        data = np.asarray(values, dtype=_TIFF_FIELD_DTYPES[field_type]).tobytes()
+        if len(data) > inline:
+            if f.tell() % 2:
+                f.write(b"\x00")
+            pointer = f.tell()
+            f.write(data)
+            data = struct.pack("<Q" if big else "<I", pointer)
+        fields.append((tag, field_type, len(values), data.ljust(inline, b"\x00")))
+
+    if f.tell() % 2:
+        f.write(b"\x00")
+    ifd_offset = f.tell()
+    if big:
+        f.write(struct.pack("<Q", len(fields)))
+        for tag, field_type, count, data in fields:
+            f.write(struct.pack("<HHQ", tag, field_type, count) + data)
+        f.write(struct.pack("<Q", 0))
+    else:
+        f.write(struct.pack("<H", len(fields)))
+        for tag, field_type, count, data in fields:
+            f.write(struct.pack("<HHI", tag, field_type, count) + data)
+        f.write(struct.pack("<I", 0))
+    return ifd_offset
+
+
+class WavWriter:
+    """
+    Incremental WAV writer: frames are written block by block and the
+    header sizes are patched on `close`.
+
+    A placeholder JUNK chunk is reserved up front, so a file that grows
+    past 4 GiB becomes RF64 (EBU Tech 3306) by rewriting the header in
+    place. Float files also get the ``fact`` chunk (sample frames) that
+    non-PCM formats require. Samples are packed with array operations: 16- and 24-bit PCM
+    (24-bit by slicing the low three bytes of each int32) or 32-bit
+    float. Optional TPDF dither adds the difference of two uniform
+    values, +/-1 LSB, before rounding.
+
+    Parameters
+    ----------
+    path : str or Path
+        Output file
+    sample_rate : int
+        Samples per second
+    channels : int
+        Interleaved channels per frame
+    bit_depth : int
+        16, 24 or 32 (float)
+    dither : bool
+        Apply TPDF dither to integer formats
+    seed : int or None
+        Dither noise seed
+    """
+
+    def __init__(
+        self,
+        path,
+        sample_rate: int,
+        channels: int = 1,
+        bit_depth: int = 16,
+        dither: bool = False,
+        seed: Optional[int] = None,
+    ):
+        if bit_depth not in (16, 24, 32):
+            raise ValueError(f"Unsupported bit depth {bit_depth}.")
+        if channels < 1:
+            raise ValueError("channels must be at least 1.")
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bit_depth = bit_depth
+        self.dither = dither and bit_depth != 32
+        self.frames_written = 0
+        self._rng = np.random.default_rng(seed)
+        self._full_scale = float(2 ** (bit_depth - 1) - 1)
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, frames: np.ndarray):
+        """
+        Append float frames in [-1, 1] of shape (n,) or (n, channels).
+        """
+        frames = np.asarray(frames)
+        if frames.ndim == 1:
+            frames = frames[:, None]
+        if frames.shape[1] != self.channels:
+            raise ValueError(f"Expected {self.channels} channels, got {frames.shape[1]}.")
+        self._file.write(self._pack(frames))
+        self.frames_written += len(frames)
+
+    def close(self):
+        """
+        Pad the data chunk, patch the header sizes and close the file.
+        """
+        f = self._file
+        if f.closed:
+            return
+        data_size = self.frames_written * self.channels * (self.bit_depth // 8)
+        if data_size % 2:
+            f.write(b"\x00")
+        riff_size = f.tell() - 8
+        sample_frames = self.frames_written
+        if riff_size > _RIFF_LIMIT:
+            f.seek(0)
+            f.write(b"RF64" + struct.pack("<I", _RF64_PLACEHOLDER))
+            f.seek(12)
+            f.write(b"ds64" + struct.pack("<IQQQI", 28, riff_size, data_size, sample_frames, 0))
+            data_size = sample_frames = _RF64_PLACEHOLDER
+        else:
+            f.seek(4)
+            f.write(struct.pack("<I", riff_size))
+        if self._fact_offset is not None:
+            f.seek(self._fact_offset)
+            f.write(struct.pack("<I", sample_frames))
+        f.seek(self._data_size_offset)
+        f.write(struct.pack("<I", data_size))
+        f.close()
+
+    def _write_header(self):
+        """
+        Write RIFF, JUNK (future ds64), fmt and, for float samples, fact
+        chunks and open the data chunk.
+        """
+        block_align = self.channels * (self.bit_depth // 8)
+        fmt_tag = _WAVE_FORMAT_IEEE_FLOAT if self.bit_depth == 32 else _WAVE_FORMAT_PCM
+        fmt = struct.pack(
+            "<HHIIHH", fmt_tag, self.channels, self.sample_rate,
+            self.sample_rate * block_align, block_align, self.bit_depth,
+        )
+        if self.channels > 2:
+            # Multichannel layouts need WAVE_FORMAT_EXTENSIBLE; no speaker mask
+            fmt = (
+                struct.pack("<H", _WAVE_FORMAT_EXTENSIBLE) + fmt[2:]
+                + struct.pack("<HHI", 22, self.bit_depth, 0)
+                + struct.pack("<I", fmt_tag) + _WAVE_GUID_TAIL
+            )
+        elif fmt_tag == _WAVE_FORMAT_IEEE_FLOAT:
+            fmt += struct.pack("<H", 0)
+
+        f = self._file
+        f.write(b"RIFF" + struct.pack("<I", 0) + b"WAVE")
+        f.write(b"JUNK" + struct.pack("<I", 28) + bytes(28))
+        f.write(b"fmt " + struct.pack("<I", len(fmt)) + fmt)
+        self._fact_offset = None
+        if fmt_tag == _WAVE_FORMAT_IEEE_FLOAT:
+            f.write(b"fact" + struct.pack("<I", 4))
+            self._fact_offset = f.tell()
+            f.write(struct.pack("<I", 0))
+        f.write(b"data")
+        self._data_size_offset = f.tell()
+        f.write(struct.pack("<I", 0))
+
+    def _pack(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Convert a block of float frames to interleaved little-endian samples.
+        """
+        if self.bit_depth == 32:
+            return np.ascontiguousarray(frames, dtype="<f4")
+
+        scaled = np.multiply(frames, self._full_scale, dtype=np.float64)
+        if self.dither:
+            noise = self._rng.random((2,) + scaled.shape)
+            scaled += noise[0]
+            scaled -= noise[1]
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -self._full_scale - 1.0, self._full_scale, out=scaled)
+        if self.bit_depth == 16:
+            return scaled.astype("<i2")
+        # 24-bit: the low three bytes of each little-endian int32
+        words = scaled.astype("<i4").reshape(-1, 1).view(np.uint8)
+        return np.ascontiguousarray(words[:, :3])
+
 
 class NoiseExporter:
     """
     Handles exporting audio and image noise to files.
+
+    Exports given a render cache key are served from the render cache
+    when it holds that render, without consuming (and so computing) a
+    lazy tile or block iterable.
     """
 
-    def __init__(self, output_directory: Path):
+    def __init__(self, output_directory: Path, cache: Optional[RenderCache] = None):
         self.output_directory = Path(output_directory)
         self.output_directory.mkdir(parents=True, exist_ok=True)
+        self.cache = cache if cache is not None else get_render_cache()
 
     # -------------------------
     # IMAGE EXPORT
@@ -26,32 +460,206 @@ class NoiseExporter:
 
     def export_image(
         self,
-        image_data: np.ndarray,
+        image_data: Union[np.ndarray, Iterable[Tuple[int, int, np.ndarray]]],
         filename: str,
         file_format: str = "png",
         bit_depth: int = 8,
         color_space: str = "sRGB",
         compression: Optional[int] = None,
-    ):
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        tiled: bool = False,
+        cache_key: Optional[str] = None,
+    ) -> Path:
         """
         Export image noise to disk.
 
+        The image is written `EXPORT_BLOCK_ROWS` rows at a time, and a
+        tile iterable is consumed one row of tiles at a time, so images
+        larger than memory can be exported straight from
+        `ImageNoiseGenerator.iter_tiles`.
+
         Parameters
         ----------
-        image_data : np.ndarray
-            Image array (H, W) or (H, W, C)
+        image_data : np.ndarray or iterable
+            Image array (H, W) or (H, W, C) with values in [0, 1], or
+            row-major ``(x, y, tile)`` tuples
         filename : str
             Output filename without extension
         file_format : str
-            png, jpg, tiff, exr, etc.
+            png or tiff
         bit_depth : int
-            8, 16, or 32
+            8 or 16; tiff also takes 32 (float samples)
         color_space : str
-            sRGB, linear, etc.
+            sRGB or linear; recorded in PNG files
         compression : int or None
-            Compression level if applicable
+            zlib level. PNG defaults to `DEFAULT_PNG_COMPRESSION`; TIFF is
+            uncompressed unless a level is given (deflate)
+        width, height : int or None
+            Full image size; required for tile input
+        tiled : bool
+            Write a tiled instead of a striped TIFF
+        cache_key : str or None
+            `render_key` of the image; a cached render replaces
+            `image_data`
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the written file
+        """
+        file_format = file_format.lower()
+        if file_format not in ("png", "tif", "tiff"):
+            raise ValueError(f"Unsupported image format '{file_format}'.")
+        if bit_depth not in (8, 16, 32) or (file_format == "png" and bit_depth == 32):
+            raise ValueError(f"Unsupported bit depth {bit_depth} for {file_format}.")
+        if color_space not in ("sRGB", "linear"):
+            raise ValueError(f"Unsupported color space '{color_space}'.")
+
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            image_data = cached
+        if isinstance(image_data, np.ndarray):
+            height, width = image_data.shape[:2]
+            bands = (
+                (y, image_data[y:y + EXPORT_BLOCK_ROWS])
+                for y in range(0, height, EXPORT_BLOCK_ROWS)
+            )
+        else:
+            if width is None or height is None:
+                raise ValueError("width and height are required for tile input.")
+            bands = iter_tile_bands(image_data, width)
+
+        # The first band tells the channel count
+        first = next(iter(bands), None)
+        if first is None:
+            raise ValueError("No image data to export.")
+        channels = first[1].shape[2] if first[1].ndim == 3 else 1
+        if channels not in _PNG_COLOR_TYPES:
+            raise ValueError(f"Unsupported channel count {channels}.")
+        blocks = iter_row_blocks(itertools.chain([first], bands), EXPORT_BLOCK_ROWS, height)
+
+        if file_format == "png":
+            path = self.output_directory / f"{filename}.png"
+            level = DEFAULT_PNG_COMPRESSION if compression is None else compression
+            with open(path, "wb") as f:
+                _write_png(f, blocks, width, height, channels, bit_depth, color_space, level)
+        else:
+            path = self.output_directory / f"{filename}.tiff"
+            with open(path, "wb") as f:
+                _write_tiff(f, blocks, width, height, channels, bit_depth, compression, tiled)
+        return path
+
+    def export_image_tiles(
+        self,
+        tiles: Iterable[Tuple[int, int, np.ndarray]],
+        filename: str,
+        width: int,
+        height: int,
+        dtype=np.float32,
+    ) -> Path:
         """
-        raise NotImplementedError("Image export not implemented yet.")
+        Stream tiled image noise to a ``.npy`` file.
+
+        Tiles are written one band at a time, so the full image is never
+        held in memory.
+
+        Parameters
+        ----------
+        tiles : iterable
+            Row-major ``(x, y, tile)`` tuples, e.g. from
+            `ImageNoiseGenerator.iter_tiles`
+        filename : str
+            Output filename without extension
+        width, height : int
+            Full image size in pixels
+        dtype : numpy dtype
+            Sample type stored on disk
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the written file
+        """
+        path = self.output_directory / f"{filename}.npy"
+        dtype = np.dtype(dtype)
+        header = {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (height, width),
+        }
+
+        rows_written = 0
+        with open(path, "wb") as f:
+            np.lib.format.write_array_header_1_0(f, header)
+            for y, band in iter_tile_bands(tiles, width):
+                if y + band.shape[0] > height:
+                    raise ValueError("Tiles extend past the image height.")
+                f.write(np.ascontiguousarray(band, dtype=dtype).tobytes())
+                rows_written += band.shape[0]
+
+        if rows_written != height:
+            raise ValueError(f"Expected {height} rows of tiles, got {rows_written}.")
+        return path
+
+    def export_contact_sheet(
+        self,
+        images: np.ndarray,
+        filename: str,
+        columns: Optional[int] = None,
+        padding: int = 4,
+        background: float = 0.0,
+    ) -> Path:
+        """
+        Export a stack of images as one PNG grid for side-by-side comparison.
+
+        Parameters
+        ----------
+        images : np.ndarray
+            Stack of shape (N, H, W) or (N, H, W, C) with values in [0, 1],
+            e.g. from `ImageNoiseGenerator.generate_batch`
+        filename : str
+            Output filename without extension
+        columns : int or None
+            Images per row; defaults to a near-square grid
+        padding : int
+            Gap between images in pixels
+        background : float
+            Gap and empty-cell brightness in [0, 1]
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the written file
+        """
+        from PIL import Image
+
+        count, height, width = images.shape[:3]
+        if count == 0:
+            raise ValueError("No images to export.")
+        if columns is None:
+            columns = int(np.ceil(np.sqrt(count)))
+        rows = -(-count // columns)
+        channels = images.shape[3:]
+
+        # Each cell carries its gap on the right/bottom; the grid is then
+        # laid out with one reshape instead of a per-image paste.
+        cells = np.full(
+            (rows * columns, height + padding, width + padding) + channels,
+            np.uint8(round(float(np.clip(background, 0.0, 1.0)) * 255)),
+            dtype=np.uint8,
+        )
+        np.multiply(
+            np.clip(images, 0.0, 1.0), 255.0,
+            out=cells[:count, :height, :width], casting="unsafe",
+        )
+        sheet = cells.reshape((rows, columns) + cells.shape[1:]).swapaxes(1, 2)
+        sheet = sheet.reshape((rows * (height + padding), columns * (width + padding)) + channels)
+        sheet = sheet[:sheet.shape[0] - padding, :sheet.shape[1] - padding]
+
+        path = self.output_directory / f"{filename}.png"
+        Image.fromarray(np.ascontiguousarray(sheet)).save(path)
+        return path
 
     # -------------------------
     # AUDIO EXPORT
@@ -59,32 +667,80 @@ class NoiseExporter:
 
     def export_audio(
         self,
-        audio_data: np.ndarray,
+        audio_data: Union[np.ndarray, Iterable[np.ndarray]],
         filename: str,
         sample_rate: int,
         file_format: str = "wav",
         bit_depth: int = 16,
         bitrate: Optional[int] = None,
         normalize: bool = False,
-    ):
+        dither: bool = False,
+        cache_key: Optional[str] = None,
+    ) -> Path:
         """
         Export audio noise to disk.
 
+        Blocks are packed and written as they arrive (see `WavWriter`),
+        so exporting e.g. `AudioNoiseGenerator.stream` runs in constant
+        memory for any length; files over 4 GiB are written as RF64.
+
         Parameters
         ----------
-        audio_data : np.ndarray
-            Audio samples (mono or stereo)
+        audio_data : np.ndarray or iterable of np.ndarray
+            Audio samples (mono or multichannel) in [-1, 1], or blocks
+            of them
         filename : str
             Output filename without extension
         sample_rate : int
             Samples per second
         file_format : str
-            wav, flac, mp3, ogg, etc.
+            wav
         bit_depth : int
-            16, 24, 32
+            16, 24 (PCM) or 32 (float)
         bitrate : int or None
             Bitrate for compressed formats
         normalize : bool
-            Normalize audio before export
+            Scale the peak to full scale; needs `audio_data` as an array
+        dither : bool
+            Apply TPDF dither to 16- and 24-bit output
+        cache_key : str or None
+            `render_key` of the clip; a cached render replaces
+            `audio_data`
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the written file
         """
-        raise NotImplementedError("Audio export not implemented yet.")
+        if file_format.lower() != "wav":
+            raise ValueError(f"Unsupported audio format '{file_format}'.")
+
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            audio_data = cached
+        if isinstance(audio_data, np.ndarray):
+            gain = 1.0
+            if normalize:
+                peak = float(np.max(np.abs(audio_data), initial=0.0))
+                gain = 1.0 / peak if peak > 0 else 1.0
+            blocks = (
+                audio_data[start:start + EXPORT_AUDIO_BLOCK] * gain if gain != 1.0
+                else audio_data[start:start + EXPORT_AUDIO_BLOCK]
+                for start in range(0, len(audio_data), EXPORT_AUDIO_BLOCK)
+            )
+            channels = audio_data.shape[1] if audio_data.ndim == 2 else 1
+        else:
+            if normalize:
+                raise ValueError("normalize needs the whole clip; pass an array.")
+            blocks = iter(audio_data)
+            first = next(blocks, None)
+            if first is None:
+                raise ValueError("No audio data to export.")
+            channels = first.shape[1] if first.ndim == 2 else 1
+            blocks = itertools.chain([first], blocks)
+
+        path = self.output_directory / f"{filename}.wav"
+        with WavWriter(path, sample_rate, channels, bit_depth, dither) as writer:
+            for block in blocks:
+                writer.write(block)
+        return path
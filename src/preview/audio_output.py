@@ -4,35 +4,308 @@ Audio preview output module.
 Handles playback of preview-quality audio noise.
 """
 
-from typing import Optional
+import threading
+from typing import Iterable, Iterator, Optional, Union
 
 import numpy as np
 
 
+# Frames per device callback.
+DEFAULT_BLOCK_SIZE = 1024
+
+# Ring buffer length; bounds how far the producer runs ahead of the device,
+# and so how long a swapped source takes to be heard.
+DEFAULT_BUFFER_SECONDS = 0.1
+
+# Length of the crossfade when the source is swapped during playback.
+DEFAULT_CROSSFADE_SECONDS = 0.03
+
+
+class RingBuffer:
+    """
+    Preallocated single-producer, single-consumer ring of float32 frames.
+
+    One thread writes and one thread reads. Each side only advances its
+    own counter, and the counters are plain ints, so neither side needs
+    a lock.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.channels = channels
+        self._data = np.zeros((capacity, channels), dtype=np.float32)
+        self._written = 0
+        self._read = 0
+
+    def available(self) -> int:
+        """
+        Return the number of frames ready to read.
+        """
+        return self._written - self._read
+
+    def space(self) -> int:
+        """
+        Return the number of frames that can be written without overrun.
+        """
+        return self.capacity - (self._written - self._read)
+
+    def clear(self):
+        """
+        Drop all buffered frames. Only call while neither side is active.
+        """
+        self._written = 0
+        self._read = 0
+
+    def write(self, frames: np.ndarray) -> int:
+        """
+        Copy as many leading frames of `frames` as fit; return the count.
+
+        Parameters
+        ----------
+        frames : np.ndarray
+            Samples of shape (n,) for mono or (n, channels)
+        """
+        if frames.ndim == 1:
+            frames = frames[:, None]
+        count = min(len(frames), self.space())
+        start = self._written % self.capacity
+        first = min(count, self.capacity - start)
+        self._data[start:start + first] = frames[:first]
+        self._data[:count - first] = frames[first:count]
+        self._written += count
+        return count
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Copy up to ``len(out)`` frames into `out`; return the count.
+
+        Only slices of the two preallocated arrays are touched, so no
+        sample memory is allocated. This is safe to call from an audio
+        callback.
+        """
+        count = min(len(out), self._written - self._read)
+        start = self._read % self.capacity
+        first = min(count, self.capacity - start)
+        out[:first] = self._data[start:start + first]
+        out[first:count] = self._data[:count - first]
+        self._read += count
+        return count
+
+
+def iter_blocks(audio_data: np.ndarray, block_size: int) -> Iterator[np.ndarray]:
+    """
+    Yield consecutive `block_size`-frame views of `audio_data`.
+    """
+    for start in range(0, len(audio_data), block_size):
+        yield audio_data[start:start + block_size]
+
+
+def make_loop(audio_data: np.ndarray, crossfade_frames: int) -> np.ndarray:
+    """
+    Return a seamlessly loopable copy of `audio_data`.
+
+    The last `crossfade_frames` frames are folded onto the start with an
+    equal-power crossfade, so the loop is that much shorter than the
+    input. Where it wraps, the end runs into what originally followed
+    it, so there is no click.
+    """
+    length = len(audio_data) - crossfade_frames
+    if crossfade_frames < 1 or length < crossfade_frames:
+        raise ValueError("audio_data must be at least twice the crossfade length.")
+    loop = audio_data[:length].copy()
+    ramp = np.linspace(0.0, 0.5 * np.pi, crossfade_frames)
+    if loop.ndim > 1:
+        ramp = ramp[:, None]
+    loop[:crossfade_frames] *= np.sin(ramp)
+    loop[:crossfade_frames] += np.cos(ramp) * audio_data[length:]
+    return loop
+
+
+def iter_loop(loop: np.ndarray, block_size: int) -> Iterator[np.ndarray]:
+    """
+    Yield `block_size`-frame views of `loop` forever, wrapping around.
+
+    Blocks are views, so repeating a loop allocates nothing; the block
+    at the wrap point is shorter.
+    """
+    start = 0
+    while True:
+        yield loop[start:start + block_size]
+        start += block_size
+        if start >= len(loop):
+            start = 0
+
+
+def _take(blocks: Iterator[np.ndarray], frames: int, channels: int):
+    """
+    Pull `frames` frames from `blocks` as a zero-padded (frames, channels)
+    array; return it with the frame count actually read and any leftover.
+    """
+    taken = np.zeros((frames, channels), dtype=np.float32)
+    count = 0
+    leftover = None
+    for block in blocks:
+        if block.ndim == 1:
+            block = block[:, None]
+        size = min(len(block), frames - count)
+        taken[count:count + size] = block[:size]
+        count += size
+        if size < len(block):
+            leftover = block[size:]
+        if count == frames:
+            break
+    return taken, count, leftover
+
+
+def crossfade(
+    old: Iterator[np.ndarray],
+    new: Iterator[np.ndarray],
+    frames: int,
+    channels: int = 1,
+) -> Iterator[np.ndarray]:
+    """
+    Yield an equal-power crossfade from `old` to `new`, then the rest of `new`.
+
+    The first `frames` frames of both sources are mixed with cosine and
+    sine ramps, which keeps the loudness of uncorrelated noise constant
+    through the transition. `old` is not read any further.
+    """
+    incoming, incoming_count, leftover = _take(new, frames, channels)
+    outgoing, outgoing_count, _ = _take(old, frames, channels)
+    ramp = np.linspace(0.0, 0.5 * np.pi, frames)[:, None]
+    incoming *= np.sin(ramp)
+    outgoing *= np.cos(ramp)
+    incoming += outgoing
+    yield incoming[:max(incoming_count, outgoing_count)]
+    if leftover is not None:
+        yield leftover
+    yield from new
+
+
 class AudioPreviewPlayer:
     """
     Handles audio playback for previews.
+
+    A producer thread pulls blocks from the source and copies them into
+    a preallocated ring buffer; the sounddevice callback only copies
+    frames back out. Playback starts as soon as the first block is
+    buffered, so long or endless sources never need rendering up front.
+    `swap` replaces the source while the device stays open.
+
+    `backend` provides ``OutputStream`` and ``CallbackStop`` with the
+    sounddevice API; it defaults to sounddevice itself, imported on the
+    first `play`, and tests pass a fake device.
     """
 
-    def __init__(self, sample_rate: int = 44100):
+    def __init__(
+        self,
+        sample_rate: int = 44100,
+        channels: int = 1,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        buffer_seconds: float = DEFAULT_BUFFER_SECONDS,
+        backend=None,
+    ):
         self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_size = block_size
+        self._backend = backend
+        capacity = max(2 * block_size, int(sample_rate * buffer_seconds))
+        self._ring = RingBuffer(capacity, channels)
+        self._stream = None
+        self._producer: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._primed = threading.Event()
+        self._source_done = False
+        self._swap_lock = threading.Lock()
+        self._pending = None
+        self._callback_stop = None
         self._is_playing = False
 
-    def play(self, audio_data: np.ndarray):
+    def play(self, audio_data: Union[np.ndarray, Iterable[np.ndarray]]):
         """
         Play audio data.
 
+        Any current playback is stopped first. Returns once the first
+        block is buffered and the device is running.
+
+        Parameters
+        ----------
+        audio_data : np.ndarray or iterable of np.ndarray
+            Audio samples (mono or multichannel), or an iterable of
+            blocks such as `AudioNoiseGenerator.stream`
+        """
+        if self._backend is None:
+            import sounddevice
+            self._backend = sounddevice
+        sd = self._backend
+
+        self.stop()
+        if isinstance(audio_data, np.ndarray):
+            audio_data = iter_blocks(audio_data, self.block_size)
+        self._start_producer(iter(audio_data))
+        self._primed.wait()
+
+        self._callback_stop = sd.CallbackStop
+        try:
+            self._stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype="float32",
+                blocksize=self.block_size,
+                callback=self._callback,
+                finished_callback=self._on_finished,
+            )
+            self._is_playing = True
+            self._stream.start()
+        except Exception:
+            self.stop()
+            raise
+
+    def swap(
+        self,
+        audio_data: Union[np.ndarray, Iterable[np.ndarray]],
+        crossfade_seconds: float = DEFAULT_CROSSFADE_SECONDS,
+    ):
+        """
+        Replace the playing source without stopping the device.
+
+        The producer crossfades from the current source to the new one
+        at its next block, so the change is heard after at most the
+        buffered audio plus the crossfade. If nothing is playing, this
+        simply starts playback.
+
         Parameters
         ----------
-        audio_data : np.ndarray
-            Audio samples (mono or stereo)
+        audio_data : np.ndarray or iterable of np.ndarray
+            New audio samples or block iterable
+        crossfade_seconds : float
+            Length of the equal-power crossfade
         """
-        raise NotImplementedError("Audio playback not implemented yet.")
+        if isinstance(audio_data, np.ndarray):
+            audio_data = iter_blocks(audio_data, self.block_size)
+        blocks = iter(audio_data)
+        frames = max(1, int(self.sample_rate * crossfade_seconds))
+        with self._swap_lock:
+            live = self._is_playing and not self._source_done
+            if live:
+                self._pending = (blocks, frames)
+        if not live:
+            self.play(blocks)
 
     def stop(self):
         """
         Stop audio playback.
         """
+        self._stop_event.set()
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        if self._producer is not None:
+            self._producer.join()
+            self._producer = None
         self._is_playing = False
 
     def is_playing(self) -> bool:
@@ -40,3 +313,63 @@ class AudioPreviewPlayer:
         Return whether audio is currently playing.
         """
         return self._is_playing
+
+    def _start_producer(self, blocks: Iterator[np.ndarray]):
+        """
+        Reset the ring buffer and start filling it from `blocks`.
+        """
+        self._ring.clear()
+        self._stop_event.clear()
+        self._primed.clear()
+        self._source_done = False
+        self._pending = None
+        self._producer = threading.Thread(target=self._produce, args=(blocks,), daemon=True)
+        self._producer.start()
+
+    def _produce(self, blocks: Iterator[np.ndarray]):
+        """
+        Producer thread: copy blocks into the ring, waiting while it is full.
+        """
+        # Wait about half a device block for the callback to free space.
+        poll_interval = 0.5 * self.block_size / self.sample_rate
+        try:
+            while True:
+                with self._swap_lock:
+                    if self._pending is not None:
+                        new_blocks, frames = self._pending
+                        self._pending = None
+                        blocks = crossfade(blocks, new_blocks, frames, self.channels)
+                    block = next(blocks, None)
+                    if block is None:
+                        # Marked done under the lock so a racing swap restarts playback
+                        self._source_done = True
+                        break
+                offset = 0
+                while offset < len(block):
+                    if self._stop_event.is_set():
+                        return
+                    written = self._ring.write(block[offset:])
+                    offset += written
+                    if not written:
+                        self._primed.set()
+                        self._stop_event.wait(poll_interval)
+                self._primed.set()
+        finally:
+            self._source_done = True
+            self._primed.set()
+
+    def _callback(self, outdata: np.ndarray, frames: int, time, status):
+        """
+        sounddevice callback: copy buffered frames out, never allocating.
+        """
+        count = self._ring.read_into(outdata)
+        if count < frames:
+            outdata[count:] = 0.0
+            if self._source_done and not self._ring.available():
+                raise self._callback_stop
+
+    def _on_finished(self):
+        """
+        Called by sounddevice once the stream has stopped.
+        """
+        self._is_playing = False
@@ -16,6 +16,8 @@ logging.basicConfig(level=logging.INFO)
 
 from ui import theme as ui_theme
 from utils.config import load_settings, save_settings, ensure_app_dirs, get_app_dirs
+from engine.render_cache import configure_render_cache
+from export.export_queue import flush_exports, get_export_queue
 
 
 class MainWindow:
@@ -42,6 +44,11 @@ class MainWindow:
         # Ensure user directories exist and load settings
         ensure_app_dirs()
         self.settings = load_settings()
+        # Seeded renders persist across sessions in the cache directory;
+        # the files are written off the UI thread, like autosaves
+        configure_render_cache(
+            directory=get_app_dirs()["base"] / "cache", submit=get_export_queue().submit,
+        )
 
         self._setup_fonts()
 
@@ -73,6 +80,8 @@ class MainWindow:
                 dpg.destroy_context()
             except Exception:
                 pass
+            # Let queued autosaves finish before the process exits
+            flush_exports()
 
     def _setup_fonts(self):
         """Load custom fonts safely using absolute paths and fallbacks."""
@@ -193,6 +202,9 @@ class MainWindow:
     def switch_panel(self, panel_name: str):
         if panel_name not in ("sound", "image"):
             raise ValueError("Invalid panel name")
+        if self.active_panel == "sound" and panel_name != "sound":
+            # The live preview loop never ends on its own
+            self.sound_panel.stop_audio()
         self.active_panel = panel_name
         self._show_active_panel()
 
@@ -299,12 +311,15 @@ class MainWindow:
 
     def _set_noise_type(self, noise_type: str):
         self.image_panel.noise_type = noise_type
-        self.sound_panel.noise_type = noise_type
         # Trigger immediate live preview if enabled
         if getattr(self.image_panel, "live_preview", False):
             self._safe_call(self.image_panel.on_generate_clicked)
-        if getattr(self.sound_panel, "live_preview", False):
-            self._safe_call(self.sound_panel.on_play_clicked)
+        # The sound panel swaps a playing stream in place; while hidden it
+        # only records the type, so its live preview stays silent
+        if self.active_panel == "sound":
+            self._safe_call(self.sound_panel.on_noise_type_changed, noise_type)
+        else:
+            self.sound_panel.noise_type = noise_type
 
     def _set_seed(self, seed_value: int):
         try:
@@ -344,15 +359,14 @@ class MainWindow:
         self.image_panel.on_resolution_changed(self.image_panel.width, app_data)
 
     def _on_duration_changed(self, sender, app_data):
-        self.sound_panel.duration = app_data
-        if self.sound_panel.live_preview:
-            self.sound_panel.on_play_clicked()
+        self.sound_panel.on_duration_changed(app_data)
 
     def _on_image_live_preview_changed(self, sender, app_data):
         self.image_panel.live_preview = app_data
 
     def _on_sound_live_preview_changed(self, sender, app_data):
-        self.sound_panel.live_preview = app_data
+        # Unchecking stops the endless preview loop; checking restarts it
+        self.sound_panel.set_live_preview(app_data)
 
     # -------------------------
     # Export callbacks (optional, placeholder)
@@ -406,7 +420,8 @@ class MainWindow:
         if self.active_panel == "image" and self.image_panel.live_preview:
             self.image_panel.on_generate_clicked()
         elif self.active_panel == "sound" and self.sound_panel.live_preview:
-            self.sound_panel.on_play_clicked()
+            # Replays the cached loop; only renders when parameters changed
+            self.sound_panel.refresh_live_preview()
 
     # -------------------------
     # Timer / animation helpers
@@ -7,7 +7,19 @@ with live preview and professional layout.
 
 import dearpygui.dearpygui as dpg
 import numpy as np
-from engine.image_noise import ImageNoiseGenerator
+from engine.image_noise import ImageNoiseGenerator, spectral_plan
+from engine.render_cache import get_render_cache, render_key
+from export.export_queue import get_export_queue
+
+def _write_png(fname, image_data):
+    """Export-queue job: encode and write one autosaved image."""
+    from PIL import Image
+    try:
+        Image.fromarray(image_data).save(fname)
+        print(f"Saved generated image to {fname}")
+    except Exception as exc:
+        print("Failed to auto-save image:", exc)
+
 
 class ImagePanel:
     """UI panel for image noise generation and preview."""
@@ -29,6 +41,9 @@ class ImagePanel:
         # Currently generated image array (for export)
         self.current_image = None
 
+        # Reusable conversion buffers, reallocated when the resolution changes
+        self._buffers = None
+
     # -------------------------
     # Panel visibility
     # -------------------------
@@ -44,6 +59,9 @@ class ImagePanel:
     # Resolution changes
     # -------------------------
     def on_resolution_changed(self, width: int, height: int):
+        if (width, height) != (self.width, self.height):
+            # Spectral plans of the old size would only hold memory
+            spectral_plan.cache_clear()
         self.width = width
         self.height = height
         if self.live_preview:
@@ -62,33 +80,48 @@ class ImagePanel:
     # -------------------------
     def on_generate_clicked(self, sender=None, app_data=None):
         """Generate noise and update the preview canvas."""
-        # Step 1: Generate noise using the engine
-        generator = ImageNoiseGenerator(
-            width=self.width,
-            height=self.height,
-            seed=self.seed
+        buffers = self._conversion_buffers()
+        noise = buffers["noise"]
+
+        # Step 1: Generate noise using the engine, unless this seeded
+        # render is cached (its autosave was written the first time)
+        cache = get_render_cache()
+        key = render_key(
+            "image", self.noise_type, {"width": self.width, "height": self.height},
+            self.seed, noise.dtype,
         )
-
-        if self.noise_type == "white":
-            noise = generator.generate_white_noise()
-        elif self.noise_type == "pink":
-            noise = generator.generate_pink_noise()
-        elif self.noise_type == "brown":
-            noise = generator.generate_brown_noise()
+        cached = cache.get(key)
+        if cached is not None:
+            np.copyto(noise, cached)
         else:
-            noise = generator.generate_white_noise()
-
-        self.current_image = noise  # save for export
-
-        # Step 2: Convert to 0-255 uint8 format
-        image_data = np.clip(noise * 255, 0, 255).astype(np.uint8)
-
-        # Convert grayscale to RGB
-        if len(image_data.shape) == 2:
-            image_data = np.stack([image_data] * 3, axis=-1)
-
-        # Flatten for Dear PyGui (normalized to 0-1)
-        flat_image = image_data.flatten() / 255.0
+            generator = ImageNoiseGenerator(
+                width=self.width,
+                height=self.height,
+                seed=self.seed
+            )
+            if self.noise_type == "white":
+                generator.generate_white_noise(out=noise)
+            elif self.noise_type == "pink":
+                generator.generate_pink_noise(out=noise)
+            elif self.noise_type == "brown":
+                generator.generate_brown_noise(out=noise)
+            else:
+                generator.generate_white_noise(out=noise)
+            cache.put(key, noise)
+
+        # Save for export. The noise buffer is clipped below and reused by
+        # the next generation, so keep a copy that stays valid for callers.
+        self.current_image = noise.copy()
+
+        # Step 2: Convert to 0-255 uint8 RGB in place (no full-size temporaries)
+        np.clip(noise, 0.0, 1.0, out=noise)
+        image_data = buffers["rgb"]
+        np.multiply(noise, 255.0, out=image_data[..., 0], casting="unsafe")
+        np.copyto(image_data[..., 1:], image_data[..., :1])
+
+        # Flat RGB texture for Dear PyGui (0-1 floats)
+        flat_image = buffers["texture"]
+        np.copyto(flat_image.reshape(self.height, self.width, 3), noise[..., None])
 
         # Step 3: Update Dear PyGui texture (best-effort; skip if DPG isn't initialized or UI disabled)
         if getattr(self, "ui_enabled", False):
@@ -120,19 +153,36 @@ class ImagePanel:
                 pass
 
 
-        # Auto-save generated image
+        if cached is None:
+            self._autosave(image_data)
+
+    def _autosave(self, image_data):
+        """Queue `image_data` (uint8 RGB) for saving to the images directory.
+
+        Encoding and writing run on the export worker; a newer image
+        replaces one still waiting, so live preview only saves the latest.
+        """
         try:
             from utils.config import get_app_dirs
-            from PIL import Image
             from datetime import datetime
             dirs = get_app_dirs()
             fname = dirs["images"] / f"image_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            img = Image.fromarray(image_data)
-            img.save(fname)
-            print(f"Saved generated image to {fname}")
+            # The RGB buffer is reused by the next generation, so queue a copy
+            get_export_queue().submit(_write_png, fname, image_data.copy(), key="image_autosave")
         except Exception as exc:
             print("Failed to auto-save image:", exc)
 
+    def _conversion_buffers(self):
+        """Return the noise/RGB/texture buffers for the current resolution."""
+        shape = (self.height, self.width)
+        if self._buffers is None or self._buffers["noise"].shape != shape:
+            self._buffers = {
+                "noise": np.empty(shape, dtype=np.float32),
+                "rgb": np.empty(shape + (3,), dtype=np.uint8),
+                "texture": np.empty(self.height * self.width * 3, dtype=np.float32),
+            }
+        return self._buffers
+
     # -------------------------
     # Live preview toggling
     # -------------------------
@@ -6,9 +6,45 @@ with live preview and professional layout.
 """
 
 import numpy as np
-import sounddevice as sd
 import logging
-from engine.audio_noise import AudioNoiseGenerator
+from collections import OrderedDict
+from engine.audio_noise import AUDIO_NOISE_TYPES, AudioNoiseGenerator
+from engine.render_cache import get_render_cache, render_key
+from export.export_queue import get_export_queue
+from preview.audio_output import AudioPreviewPlayer, DEFAULT_BLOCK_SIZE, iter_loop, make_loop
+
+# Crossfade folded into each preview loop to hide the wrap point.
+LOOP_CROSSFADE_SECONDS = 0.05
+
+# Number of preview loops kept, one per parameter set.
+LOOP_CACHE_SIZE = 8
+
+# Fixed gain per noise type, applied before clipping to [-1, 1]. Streamed
+# clips cannot be peak-normalized, so it is known up front: brown and
+# shaped noise (standard deviation 0.25) peak somewhat above 1.
+PLAYBACK_GAIN = {"white": 1.0, "pink": 1.0, "brown": 0.8, "velvet": 1.0, "shaped": 0.8}
+
+
+def _apply_gain(audio, noise_type):
+    """Scale `audio` in place by the playback gain of `noise_type` and clip it."""
+    gain = PLAYBACK_GAIN[noise_type]
+    if gain != 1.0:
+        audio *= gain
+    np.clip(audio, -1.0, 1.0, out=audio)
+    return audio
+
+def _write_wav(fname, audio, sample_rate):
+    """Export-queue job: encode and write one autosaved clip."""
+    try:
+        from scipy.io.wavfile import write as wav_write
+        # audio is already normalized; convert straight into an int16 buffer
+        wav = np.empty(audio.shape, dtype=np.int16)
+        np.multiply(audio, 32767, out=wav, casting="unsafe")
+        wav_write(str(fname), sample_rate, wav)
+        print(f"Saved generated audio to {fname}")
+    except Exception as exc:
+        print("Failed to auto-save audio:", exc)
+
 
 class SoundPanel:
     """UI panel for sound noise generation and playback."""
@@ -17,8 +53,11 @@ class SoundPanel:
         self.visible = False
         self.duration = 1.0  # seconds
         self.sample_rate = 44100
+        self.channels = 1
+        self.channel_correlation = 0.0  # 0 = independent channels, 1 = identical
         self.seed = None
         self.live_preview = True
+        self.loop_preview = True  # live preview repeats a cached loop
         self.noise_type = "white"  # default noise type
 
         # Whether we are running inside the UI (MainWindow will set this)
@@ -26,7 +65,17 @@ class SoundPanel:
 
         # Internal state
         self._current_audio = None
-        self._stream = None
+        self._player = None
+
+        # Playback timeline: samples rendered by the current source and
+        # the blocks recorded for autosave
+        self._rendered = 0
+        self._recorded = []
+        self._source_token = None
+
+        # Preview loops by parameter set, and the key of the one playing
+        self._loops = OrderedDict()
+        self._playing_loop = None
 
     # -------------------------
     # Panel visibility
@@ -44,95 +93,284 @@ class SoundPanel:
     def on_noise_type_changed(self, noise_type: str):
         self.noise_type = noise_type
         if self.live_preview:
-            self.play_audio()
+            if self._is_playing() and self._playing_loop is not None:
+                self.play_loop()
+            elif self._is_playing():
+                # Crossfade into the new type on the open device
+                self._player.swap(self._playback_blocks())
+            else:
+                self.play_audio()
 
     # -------------------------
     # Duration changes
     # -------------------------
     def on_duration_changed(self, duration: float):
         self.duration = duration
-        if self.live_preview:
+        # A playing source reads the duration before every block, so it
+        # just ends earlier or later without interrupting the stream.
+        if self.live_preview and self._is_playing() and self._playing_loop is not None:
+            self.play_loop()
+        elif self.live_preview and not self._is_playing():
             self.play_audio()
 
     # -------------------------
     # Audio generation
     # -------------------------
     def generate_noise(self):
-        """Generate noise samples for the selected type."""
+        """Generate noise samples for the selected type.
+
+        Seeded renders are served from the render cache when possible;
+        a cached clip was autosaved when it was first rendered.
+        """
+        noise_type = self._engine_noise_type()
+        num_samples = int(self.sample_rate * self.duration)
+        cache = get_render_cache()
+        key = self._render_key(self._render_settings(), num_samples)
+        cached = cache.get(key)
+        if cached is not None:
+            self._current_audio = cached.copy()
+            return self._current_audio
+
         generator = AudioNoiseGenerator(
             sample_rate=self.sample_rate,
-            seed=self.seed
+            seed=self.seed,
+            channels=self.channels,
+            correlation=self.channel_correlation,
         )
 
-        if self.noise_type == "white":
-            audio = generator.generate_white_noise(self.duration)
-        elif self.noise_type == "pink":
-            audio = generator.generate_pink_noise(self.duration)
-        elif self.noise_type == "brown":
-            audio = generator.generate_brown_noise(self.duration)
-        else:
-            audio = generator.generate_white_noise(self.duration)
-
-        # Normalize audio to prevent clipping
-        max_val = np.max(np.abs(audio))
-        if max_val > 0:
-            audio = audio / max_val
+        audio = generator.fill(noise_type, np.empty(generator.frame_shape(num_samples), dtype=np.float32))
+        # Same level as playback, so a clip sounds alike in both paths
+        _apply_gain(audio, noise_type)
 
         self._current_audio = audio
-        # Auto-save generated audio
+        cache.put(key, audio)
+        self._autosave(audio)
+        return audio
+
+    def _autosave(self, audio):
+        """Queue `audio` (float samples in [-1, 1]) for saving to the sounds directory.
+
+        Encoding and writing run on the export worker; a newer clip
+        replaces one still waiting. `audio` is never modified afterwards.
+        """
         try:
             from utils.config import get_app_dirs
-            from scipy.io.wavfile import write as wav_write
             from datetime import datetime
             dirs = get_app_dirs()
             fname = dirs["sounds"] / f"sound_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
-            # normalize to int16
-            maxv = max(1.0, np.max(np.abs(audio)))
-            wav = (audio / maxv * 32767).astype('int16')
-            wav_write(str(fname), self.sample_rate, wav)
-            print(f"Saved generated audio to {fname}")
+            get_export_queue().submit(_write_wav, fname, audio, self.sample_rate, key="sound_autosave")
         except Exception as exc:
             print("Failed to auto-save audio:", exc)
-        return audio
 
     # -------------------------
     # Playback
     # -------------------------
     def play_audio(self, sender=None, app_data=None):
-        """Play the generated audio noise with graceful error handling and autosave."""
+        """Stream the selected noise to the audio device; autosave once rendered.
+
+        Blocks are rendered on the player's producer thread and sound
+        starts with the first one, so the UI thread never waits for the
+        full clip.
+        """
         self.stop_audio()  # stop existing playback
 
-        audio = self.generate_noise()
-
-        if audio is not None:
-            try:
-                self._stream = sd.OutputStream(
-                    samplerate=self.sample_rate,
-                    channels=1,
-                    dtype='float32'
-                )
-                self._stream.start()
-                # Play in a non-blocking way: write may block, but wrapping in try-catch
-                self._stream.write(audio.astype(np.float32))
-                print(f"Playing {self.noise_type} noise for {self.duration}s")
-            except Exception as exc:
-                # Log and fail gracefully if audio device or stream creation fails
-                logging.error("Audio playback failed: %s", exc)
-                self._stream = None
-
-        # Non-GUI environments: nothing else to do here; GUI-specific actions happen in the UI code.
+        self._rendered = 0
+        self._recorded = []
+
         try:
-            pass
-        except Exception:
-            pass
+            self._ensure_player()
+            self._player.play(self._playback_blocks())
+            print(f"Playing {self.noise_type} noise for {self.duration}s")
+        except Exception as exc:
+            # Log and fail gracefully if audio device or stream creation fails
+            logging.error("Audio playback failed: %s", exc)
+            self._player = None
+
+    def play_loop(self):
+        """Repeat a seamless loop of the selected noise.
+
+        The loop is rendered once per parameter set and cached, so while
+        the parameters stay the same this returns immediately and the
+        player just replays memory. A changed parameter set crossfades
+        into its own loop without stopping the device.
+        """
+        key = self._loop_key()
+        if self._is_playing() and self._playing_loop == key:
+            return
+        try:
+            loop = self._loops.get(key)
+            if loop is None:
+                loop = self._render_loop()
+                self._loops[key] = loop
+                while len(self._loops) > LOOP_CACHE_SIZE:
+                    self._loops.popitem(last=False)
+            self._loops.move_to_end(key)
+            self._current_audio = loop
+
+            blocks = iter_loop(loop, DEFAULT_BLOCK_SIZE)
+            if (
+                self._is_playing()
+                and self._player.sample_rate == self.sample_rate
+                and self._player.channels == self.channels
+            ):
+                self._player.swap(blocks)
+            else:
+                self.stop_audio()
+                self._ensure_player()
+                self._player.play(blocks)
+            self._playing_loop = key
+        except Exception as exc:
+            logging.error("Audio playback failed: %s", exc)
+            self._player = None
+            self._playing_loop = None
+
+    def refresh_live_preview(self):
+        """Keep the live preview current; called periodically by the main window."""
+        if not self.live_preview:
+            self.stop_audio()
+        elif self.loop_preview:
+            self.play_loop()
+        else:
+            self.play_audio()
+
+    def _loop_key(self):
+        """Parameters that determine the preview loop."""
+        return (
+            self.noise_type, self.seed, self.sample_rate, self.channels,
+            self.channel_correlation, self.duration,
+        )
+
+    def _render_loop(self):
+        """Render one loop of the selected noise (no autosave: it repeats forever).
+
+        Seeded loops are served from the render cache when possible.
+        """
+        noise_type = self._engine_noise_type()
+        length = max(1, int(self.sample_rate * self.duration))
+        fade = max(1, min(int(self.sample_rate * LOOP_CROSSFADE_SECONDS), length // 2))
+        cache = get_render_cache()
+        key = self._render_key(self._render_settings(), length, loop_crossfade=fade)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        generator = AudioNoiseGenerator(
+            sample_rate=self.sample_rate,
+            seed=self.seed,
+            channels=self.channels,
+            correlation=self.channel_correlation,
+        )
+        audio = generator.fill(noise_type, np.empty(generator.frame_shape(length + fade), dtype=np.float32))
+        loop = _apply_gain(make_loop(audio, fade), noise_type)
+        cache.put(key, loop)
+        return loop
+
+    def _render_settings(self):
+        """Snapshot of the settings a render depends on, for `_render_key`."""
+        return (
+            self._engine_noise_type(), self.seed, self.sample_rate, self.channels,
+            self.channel_correlation,
+        )
+
+    def _render_key(self, settings, num_samples, **params):
+        """Render cache key of `num_samples` samples rendered with `settings`."""
+        noise_type, seed, sample_rate, channels, correlation = settings
+        return render_key(
+            "audio", noise_type,
+            {
+                "sample_rate": sample_rate,
+                "channels": channels,
+                "correlation": correlation,
+                "samples": num_samples,
+                "gain": PLAYBACK_GAIN[noise_type],
+                **params,
+            },
+            seed, np.float32,
+        )
+
+    def _engine_noise_type(self):
+        """The engine noise type rendered for the selection (white if unknown)."""
+        return self.noise_type if self.noise_type in AUDIO_NOISE_TYPES else "white"
+
+    def _ensure_player(self):
+        """Create the player, or recreate it if the output format changed."""
+        if (
+            self._player is None
+            or self._player.sample_rate != self.sample_rate
+            or self._player.channels != self.channels
+        ):
+            self.stop_audio()
+            self._player = AudioPreviewPlayer(
+                sample_rate=self.sample_rate, channels=self.channels
+            )
+
+    def _playback_blocks(self):
+        """Yield float32 blocks of the selected noise from the current timeline position.
+
+        The clip length is re-read before every block, and a swapped-in
+        source takes over the timeline (and the autosave) from the one
+        it replaces. A seeded clip in the render cache is played from
+        there; a clip rendered in full from the start is cached, and
+        only rendered clips are autosaved.
+        """
+        settings = self._render_settings()
+        noise_type = settings[0]
+        generator = AudioNoiseGenerator(
+            sample_rate=self.sample_rate,
+            seed=self.seed,
+            channels=self.channels,
+            correlation=self.channel_correlation,
+        )
+        cache = get_render_cache()
+        start = pos = self._rendered
+        generator.seek(pos)
+        cached = cache.get(self._render_key(settings, int(self.sample_rate * self.duration)))
+        # Whether any block was rendered, and whether all of them continue
+        # one uninterrupted render (filters restart on a seek)
+        rendered = False
+        continuous = True
+        token = object()
+        self._source_token = token
+
+        while True:
+            size = min(DEFAULT_BLOCK_SIZE, int(self.sample_rate * self.duration) - pos)
+            if size <= 0:
+                break
+            if cached is not None and pos + size <= len(cached):
+                block = cached[pos:pos + size]
+            else:
+                if generator.position != pos:
+                    # The clip grew past its cached render
+                    generator.seek(pos)
+                    continuous = False
+                block = np.empty(generator.frame_shape(size), dtype=np.float32)
+                _apply_gain(generator.fill(noise_type, block), noise_type)
+                rendered = True
+            pos += size
+            if self._source_token is token:
+                self._rendered = pos
+                self._recorded.append(block)
+            yield block
+
+        if self._source_token is token and self._recorded:
+            self._current_audio = np.concatenate(self._recorded)
+            if rendered:
+                if start == 0 and continuous:
+                    cache.put(self._render_key(settings, pos), self._current_audio)
+                self._autosave(self._current_audio)
+
+    def _is_playing(self):
+        """Return whether the player is currently streaming."""
+        return self._player is not None and self._player.is_playing()
 
     def stop_audio(self, sender=None, app_data=None):
         """Stop audio playback."""
-        if self._stream is not None:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
-            print("Stopped audio playback")
+        self._playing_loop = None
+        if self._player is not None:
+            was_playing = self._player.is_playing()
+            self._player.stop()
+            if was_playing:
+                print("Stopped audio playback")
 
     # -------------------------
     # UI callback wrappers
@@ -149,9 +387,10 @@ class SoundPanel:
     # Live preview toggle
     # -------------------------
     def set_live_preview(self, enabled: bool):
+        """Turn live preview on (starting the loop or clip) or off (stopping playback)."""
         self.live_preview = enabled
-        if self.live_preview:
-            self.play_audio()
+        self.refresh_live_preview()
+
     # -------------------------
     # Export helper
     # -------------------------
@@ -163,11 +402,12 @@ class SoundPanel:
         """Save the last generated audio array to `path` in WAV format."""
         if self._current_audio is None:
             raise RuntimeError("No audio generated")
-        try:
-            from scipy.io.wavfile import write as wav_write
-            maxv = max(1.0, np.max(np.abs(self._current_audio)))
-            wav = (self._current_audio / maxv * 32767).astype('int16')
-            wav_write(path, self.sample_rate, wav)
-        except Exception:
-            raise
+        from export.exporter import EXPORT_AUDIO_BLOCK, WavWriter
+        audio = self._current_audio
+        maxv = max(1.0, float(np.max(np.abs(audio))))
+        channels = audio.shape[1] if audio.ndim == 2 else 1
+        # Stream through the incremental writer instead of one int16 copy
+        with WavWriter(path, self.sample_rate, channels) as writer:
+            for start in range(0, len(audio), EXPORT_AUDIO_BLOCK):
+                writer.write(audio[start:start + EXPORT_AUDIO_BLOCK] / maxv)
 
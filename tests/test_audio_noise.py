@@ -1,4 +1,7 @@
-from engine.audio_noise import AudioNoiseGenerator
+import numpy as np
+import pytest
+
+from engine.audio_noise import AUDIO_NOISE_TYPES, AudioNoiseGenerator
 
 
 def test_white_noise_length_and_range():
@@ -6,3 +9,153 @@ def test_white_noise_length_and_range():
     arr = gen.generate_white_noise(0.5)
     assert len(arr) == int(48000 * 0.5)
     assert arr.min() >= -1.0 and arr.max() <= 1.0
+
+
+def test_white_noise_dtype_and_out_buffer():
+    gen = AudioNoiseGenerator(sample_rate=8000, seed=3)
+    buf = np.empty(4000, dtype=np.float32)
+    result = gen.generate_white_noise(0.5, amplitude=0.5, out=buf)
+    assert result is buf
+    assert abs(buf).max() <= 0.5
+    assert gen.generate_white_noise(0.1, dtype=np.float32).dtype == np.float32
+
+
+def test_white_noise_stream_continues_and_seeks():
+    gen = AudioNoiseGenerator(sample_rate=1000, seed=4)
+    full = gen.generate_white_noise(1.0)
+    gen.reset_seed(4)
+    first = gen.generate_white_noise(0.25)
+    second = gen.generate_white_noise(0.25)
+    assert (np.concatenate([first, second]) == full[:500]).all()
+    gen.seek(700)
+    assert (gen.generate_white_noise(0.1) == full[700:800]).all()
+    assert gen.position == 800
+
+
+def test_generate_batch_stacks_seeded_clips():
+    batch = AudioNoiseGenerator(sample_rate=1000).generate_batch([1, 2, 3], 0.5)
+    assert batch.shape == (3, 500)
+    for i, seed in enumerate([1, 2, 3]):
+        single = AudioNoiseGenerator(sample_rate=1000, seed=seed).generate_white_noise(0.5)
+        assert (batch[i] == single).all()
+
+
+@pytest.mark.parametrize("noise_type", AUDIO_NOISE_TYPES)
+def test_generate_batch_matches_single_renders_for_every_type(noise_type):
+    gen = AudioNoiseGenerator(sample_rate=8000, channels=2, correlation=0.4)
+    batch = gen.generate_batch([4, 7], 2.1, noise_type)
+    assert batch.shape == (2, 16800, 2)
+    for row, seed in zip(batch, [4, 7]):
+        single = AudioNoiseGenerator(8000, seed, channels=2, correlation=0.4)
+        assert (row == single.fill(noise_type, np.empty(row.shape))).all()
+
+
+def test_pink_noise_blocks_join_into_one_shot_render():
+    one_shot = AudioNoiseGenerator(sample_rate=8000, seed=9).generate_pink_noise(2.0)
+    gen = AudioNoiseGenerator(sample_rate=8000, seed=9)
+    blocks = [gen.generate_pink_noise(0.25) for _ in range(8)]
+    assert (np.concatenate(blocks) == one_shot).all()
+    assert 0.1 < abs(one_shot).max() <= 1.5
+
+    # Power falls by about 3 dB per octave
+    spectrum = np.abs(np.fft.rfft(one_shot)) ** 2
+    freqs = np.fft.rfftfreq(len(one_shot), 1 / 8000)
+    low = spectrum[(freqs > 100) & (freqs < 200)].mean()
+    high = spectrum[(freqs > 1600) & (freqs < 3200)].mean()
+    assert 8 < low / high < 32
+
+
+def test_brown_noise_blocks_match_one_shot_and_do_not_drift():
+    one_shot = AudioNoiseGenerator(sample_rate=8000, seed=3).generate_brown_noise(30.0)
+    gen = AudioNoiseGenerator(sample_rate=8000, seed=3)
+    joined = np.concatenate([gen.generate_brown_noise(d) for d in (0.3, 1.7, 0.01, 27.0)])
+    assert (joined == one_shot[:len(joined)]).all()
+
+    # The leak keeps the signal centred instead of wandering like a random walk
+    assert abs(one_shot.mean()) < 0.05
+    assert abs(one_shot).max() < 1.5
+
+
+def test_stream_yields_float32_blocks_matching_one_shot():
+    one_shot = AudioNoiseGenerator(sample_rate=8000, seed=6).generate_pink_noise(1.0)
+    blocks = list(AudioNoiseGenerator(sample_rate=8000, seed=6).stream(3000, "pink", 8000))
+    assert [len(b) for b in blocks] == [3000, 3000, 2000]
+    assert all(b.dtype == np.float32 for b in blocks)
+    assert (np.concatenate(blocks) == one_shot.astype(np.float32)).all()
+
+    endless = AudioNoiseGenerator(sample_rate=8000, seed=6).stream(256, "brown")
+    assert all(len(next(endless)) == 256 for _ in range(100))
+
+
+def test_velvet_noise_density_sparse_form_and_streaming():
+    velvet = AudioNoiseGenerator(sample_rate=8000, seed=4).generate_velvet_noise(2.0, density=500)
+    assert set(np.unique(velvet)) == {-1.0, 0.0, 1.0}
+    assert np.count_nonzero(velvet) == 1000
+
+    indices, signs = AudioNoiseGenerator(sample_rate=8000, seed=4).generate_velvet_pulses(2.0, density=500)
+    assert (indices == np.flatnonzero(velvet)).all()
+    assert (signs == velvet[indices]).all()
+
+    gen = AudioNoiseGenerator(sample_rate=8000, seed=4)
+    gen.velvet_density = 500
+    blocks = list(gen.stream(777, "velvet", 16000))
+    assert (np.concatenate(blocks) == velvet.astype(np.float32)).all()
+
+    # Continuing blocks, sparse reads and seeks all stay on the same stream
+    gen.seek(3000)
+    head = gen.generate_velvet_noise(0.25)
+    indices, signs = gen.generate_velvet_pulses(0.25)
+    tail = gen.generate_velvet_noise(0.25)
+    assert (head == velvet[3000:5000]).all()
+    assert (indices == np.flatnonzero(velvet[5000:7000])).all()
+    assert (tail == velvet[7000:9000]).all()
+
+
+def test_shaped_noise_follows_curve_in_exact_blocks():
+    gen = AudioNoiseGenerator(sample_rate=16000, seed=8)
+    gen.set_spectral_curve([0, 1000, 2000, 8000], [1.0, 1.0, 0.01, 0.01])
+    one_shot = gen.generate_shaped_noise(2.0)
+    assert abs(one_shot.std() - 0.25) < 0.02
+
+    power = np.abs(np.fft.rfft(one_shot)) ** 2
+    freqs = np.fft.rfftfreq(len(one_shot), 1 / 16000)
+    assert power[freqs < 900].mean() > 1000 * power[freqs > 3000].mean()
+
+    streamed = AudioNoiseGenerator(sample_rate=16000, seed=8)
+    streamed.spectral_curve = gen.spectral_curve
+    blocks = list(streamed.stream(1500, "shaped", len(one_shot)))
+    assert (np.concatenate(blocks) == one_shot.astype(np.float32)).all()
+
+    streamed.seek(10000)
+    assert (streamed.generate_shaped_noise(0.5) == one_shot[10000:18000]).all()
+
+
+def test_multichannel_frames_with_controlled_correlation():
+    for correlation in (0.0, 0.5, 1.0):
+        gen = AudioNoiseGenerator(sample_rate=8000, seed=2, channels=4, correlation=correlation)
+        frames = gen.generate_pink_noise(10.0, dtype=np.float32)
+        assert frames.shape == (80000, 4) and frames.dtype == np.float32
+        assert frames.flags.c_contiguous
+        coeffs = np.corrcoef(frames.T)[np.triu_indices(4, 1)]
+        assert np.allclose(coeffs, correlation, atol=0.05)
+
+    stereo = AudioNoiseGenerator(sample_rate=8000, seed=2, channels=2)
+    blocks = np.concatenate(list(stereo.stream(1000, "brown", 8000)))
+    one_shot = AudioNoiseGenerator(sample_rate=8000, seed=2, channels=2).generate_brown_noise(1.0)
+    assert blocks.shape == (8000, 2)
+    assert (blocks == one_shot.astype(np.float32)).all()
+
+
+def test_render_parallel_is_identical_for_any_worker_count():
+    sequential = AudioNoiseGenerator(sample_rate=8000, seed=8)
+    reference = sequential.generate_pink_noise(100.0)
+    follow_on = sequential.generate_pink_noise(0.1)
+
+    renders = []
+    for workers in (1, 3):
+        gen = AudioNoiseGenerator(sample_rate=8000, seed=8)
+        renders.append(gen.render_parallel(100.0, "pink", workers=workers))
+        # The state carries on as if the clip had been rendered sequentially
+        assert np.allclose(gen.generate_pink_noise(0.1), follow_on, rtol=0, atol=1e-12)
+    assert (renders[0] == renders[1]).all()
+    assert np.allclose(renders[0], reference, rtol=0, atol=1e-12)
@@ -0,0 +1,152 @@
+import itertools
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+from engine.audio_noise import AudioNoiseGenerator
+from preview.audio_output import AudioPreviewPlayer, RingBuffer, crossfade, iter_loop, make_loop
+
+
+def test_ring_buffer_wraps_and_respects_capacity():
+    ring = RingBuffer(8)
+    assert ring.write(np.arange(6, dtype=np.float32)) == 6
+    out = np.empty((4, 1), dtype=np.float32)
+    assert ring.read_into(out) == 4
+    assert ring.write(np.arange(6, 12, dtype=np.float32)) == 6
+    assert ring.write(np.ones(3, dtype=np.float32)) == 0
+
+    out = np.empty((10, 1), dtype=np.float32)
+    assert ring.read_into(out) == 8
+    assert (out[:8, 0] == np.arange(4, 12)).all()
+
+
+def test_ring_buffer_reads_allocate_no_sample_memory():
+    ring = RingBuffer(4096)
+    block = np.ones(1000, dtype=np.float32)
+    out = np.empty((1000, 1), dtype=np.float32)
+    tracemalloc.start()
+    for _ in range(50):
+        ring.write(block)
+        ring.read_into(out)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < out.nbytes
+
+
+class _FakeDevice:
+    """
+    Stands in for sounddevice: each OutputStream pulls blocks through the
+    player's callback on its own thread, like a device, and records them.
+    """
+
+    class CallbackStop(Exception):
+        pass
+
+    def __init__(self):
+        self.streams = []
+
+    def OutputStream(self, **settings):
+        stream = _FakeStream(self, **settings)
+        self.streams.append(stream)
+        return stream
+
+
+class _FakeStream:
+    def __init__(self, device, samplerate, channels, dtype, blocksize, callback, finished_callback):
+        self._device = device
+        self._shape = (blocksize, channels)
+        self._callback = callback
+        self._finished_callback = finished_callback
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.blocks = []
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def close(self):
+        pass
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                outdata = np.empty(self._shape, dtype=np.float32)
+                try:
+                    self._callback(outdata, len(outdata), None, None)
+                except self._device.CallbackStop:
+                    self.blocks.append(outdata)
+                    break
+                self.blocks.append(outdata)
+                self._stopped.wait(0.001)
+        finally:
+            self._finished_callback()
+
+    def played(self):
+        return np.concatenate(self.blocks)[:, 0]
+
+
+def _wait_until_finished(player, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while player.is_playing():
+        assert time.monotonic() < deadline, "playback did not finish"
+        time.sleep(0.005)
+
+
+def test_player_streams_source_in_order():
+    blocks = AudioNoiseGenerator(sample_rate=8000, seed=1).stream(500, "pink", 8000)
+    expected = AudioNoiseGenerator(sample_rate=8000, seed=1).generate_pink_noise(1.0)
+    device = _FakeDevice()
+    player = AudioPreviewPlayer(sample_rate=8000, block_size=256, buffer_seconds=0.1, backend=device)
+    player.play(blocks)
+    _wait_until_finished(player)
+    player.stop()
+
+    (stream,) = device.streams
+    played = stream.played()
+    # Underruns play silence, so compare the audible samples in order
+    assert (played[played != 0.0] == expected.astype(np.float32)).all()
+    assert played[-1] == 0.0
+
+
+def test_crossfade_ramps_between_sources_then_continues_new():
+    old = iter([np.ones(300, dtype=np.float32)] * 10)
+    new = iter([np.full(250, 2.0, dtype=np.float32)] * 4)
+    blocks = list(crossfade(old, new, 400))
+    mixed = blocks[0][:, 0]
+    assert len(mixed) == 400
+    assert mixed[0] == 1.0 and abs(mixed[-1] - 2.0) < 1e-6
+    rest = np.concatenate([b.reshape(-1) for b in blocks[1:]])
+    assert len(rest) == 600 and (rest == 2.0).all()
+
+
+def test_swap_replaces_source_without_reopening_device():
+    device = _FakeDevice()
+    player = AudioPreviewPlayer(sample_rate=8000, block_size=256, buffer_seconds=0.1, backend=device)
+    player.play(itertools.repeat(np.zeros(256, dtype=np.float32)))
+    player.swap(np.ones(4000, dtype=np.float32), crossfade_seconds=0.01)
+    _wait_until_finished(player)
+    player.stop()
+
+    (stream,) = device.streams
+    played = stream.played()
+    # Silence, an 80-frame fade in, then the new source at full level
+    assert (played == 1.0).sum() >= 3900
+    assert played[-1] == 0.0
+
+
+def test_loop_wraps_into_what_followed_its_end():
+    audio = AudioNoiseGenerator(sample_rate=8000, seed=3).generate_pink_noise(1.0, dtype=np.float32)
+    loop = make_loop(audio, 400)
+    assert len(loop) == 7600
+    assert loop[0] == audio[7600]
+    assert (loop[400:] == audio[400:7600]).all()
+
+    blocks = iter_loop(loop, 3000)
+    assert [len(next(blocks)) for _ in range(4)] == [3000, 3000, 1600, 3000]
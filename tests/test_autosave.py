@@ -1,5 +1,6 @@
 import tempfile
 from utils.config import get_app_dirs, ensure_app_dirs
+from export.export_queue import flush_exports
 from ui.panels.image_panel import ImagePanel
 from ui.panels.sound_panel import SoundPanel
 import os
@@ -18,6 +19,7 @@ def test_image_autosave(tmp_path):
 
     ip = ImagePanel()
     ip.on_generate_clicked()
+    flush_exports()
     files = list((tmp_path / "images").glob("image_*.png"))
     assert len(files) >= 1
 
@@ -38,6 +40,7 @@ def test_sound_autosave(tmp_path):
     sp = SoundPanel()
     sp.duration = 0.1
     sp.generate_noise()
+    flush_exports()
     files = list((tmp_path / "sound").glob("sound_*.wav"))
     assert len(files) >= 1
 
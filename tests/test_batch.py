@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from scipy.io import wavfile
+
+from batch import expand_sweep, main, make_job, parse_seeds
+from export.presets import save_preset
+
+
+def test_expand_sweep_crosses_axes():
+    base = make_job({"noise_type": "perlin", "width": 32, "height": 16})
+    jobs = expand_sweep([base], noise_types=["perlin", "worley"], seeds=parse_seeds("1-2,9"),
+                        params={"scale": [2, 4]})
+    assert len(jobs) == 12
+    assert len({job["name"] for job in jobs}) == 12
+    assert {job["params"]["scale"] for job in jobs} == {2, 4}
+    assert all(job["width"] == 32 and job["bit_depth"] == 8 for job in jobs)
+
+
+def test_batch_renders_presets_and_sweeps(tmp_path):
+    save_preset(
+        {"kind": "audio", "noise_type": "pink", "seed": 3, "sample_rate": 8000, "duration": 0.25},
+        tmp_path / "hiss.json",
+    )
+    assert main([str(tmp_path / "hiss.json"), "--workers", "1", "--output", str(tmp_path / "out")]) == 0
+    rate, audio = wavfile.read(tmp_path / "out" / "hiss.wav")
+    assert rate == 8000 and len(audio) == 2000
+
+    assert main([
+        "--kind", "image", "--noise-type", "perlin,pink", "--seeds", "1-2",
+        "--width", "40", "--height", "24", "--workers", "2", "--output", str(tmp_path / "sweep"),
+    ]) == 0
+    assert len(list((tmp_path / "sweep").glob("*.png"))) == 4
+
+    assert main(["--kind", "image", "--noise-type", "cloud", "--workers", "1",
+                 "--output", str(tmp_path / "bad")]) == 1
+
+
+def test_batch_does_not_import_ui(tmp_path):
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys, app\n"
+        f"app.main(['render', '--width', '16', '--height', '16', '--workers', '1', '--output', {str(tmp_path)!r}])\n"
+        "assert 'dearpygui' not in sys.modules and 'sounddevice' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=src, check=True)
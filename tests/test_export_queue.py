@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from export.export_queue import ExportQueue
+
+
+def test_export_queue_coalesces_and_applies_backpressure():
+    queue = ExportQueue(max_pending=2)
+    gate = threading.Event()
+    started = threading.Event()
+    written = []
+
+    def blocker():
+        started.set()
+        gate.wait()
+
+    queue.submit(blocker)
+    started.wait()
+    for i in range(5):
+        assert queue.submit(written.append, f"preview {i}", key="autosave")
+    assert queue.submit(written.append, "export")
+    # Both slots are taken, and the worker is still busy
+    assert not queue.submit(written.append, "extra", block=False)
+    assert queue.dropped == 4
+
+    gate.set()
+    assert queue.flush(timeout=5.0)
+    assert written == ["preview 4", "export"]
+    queue.close()
+    with pytest.raises(RuntimeError):
+        queue.submit(written.append, "late")
+
+
+def test_export_queue_survives_failing_jobs():
+    queue = ExportQueue()
+    written = []
+    queue.submit(lambda: 1 / 0)
+    queue.submit(written.append, "next")
+    queue.close()
+    assert written == ["next"]
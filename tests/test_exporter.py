@@ -0,0 +1,142 @@
+import numpy as np
+
+from engine.image_noise import ImageNoiseGenerator
+from export.exporter import NoiseExporter
+
+
+def test_export_image_tiles_streams_to_npy(tmp_path):
+    gen = ImageNoiseGenerator(90, 50, seed=4)
+    exporter = NoiseExporter(tmp_path)
+    path = exporter.export_image_tiles(
+        gen.iter_tiles("perlin", tile_size=32, scale=3.0, octaves=2),
+        "tiled", width=90, height=50,
+    )
+    loaded = np.load(path)
+    expected = gen.generate_perlin_noise(scale=3.0, octaves=2).astype(np.float32)
+    assert loaded.shape == (50, 90)
+    assert (loaded == expected).all()
+
+
+def test_export_contact_sheet_lays_out_seed_batch(tmp_path):
+    from PIL import Image
+
+    batch = ImageNoiseGenerator(20, 10).generate_batch([1, 2, 3], "perlin", scale=2.0)
+    path = NoiseExporter(tmp_path).export_contact_sheet(batch, "sheet", columns=2, padding=3)
+    sheet = np.asarray(Image.open(path))
+    assert sheet.shape == (2 * 10 + 3, 2 * 20 + 3)
+    expected = (batch[2] * 255.0).astype(np.uint8)
+    assert (sheet[13:23, 0:20] == expected).all()
+    assert (sheet[13:, 23:] == 0).all()
+
+
+def test_export_image_streams_tiles_to_16_bit_png_and_tiff(tmp_path):
+    from PIL import Image
+
+    gen = ImageNoiseGenerator(300, 270, seed=5)
+    expected = (gen.generate_perlin_noise(scale=3.0, octaves=2) * 65535).astype(np.uint16)
+    exporter = NoiseExporter(tmp_path)
+    for file_format, tiled in (("png", False), ("tiff", False), ("tiff", True)):
+        path = exporter.export_image(
+            gen.iter_tiles("perlin", tile_size=64, scale=3.0, octaves=2),
+            f"noise_{tiled}", file_format, bit_depth=16, width=300, height=270, tiled=tiled,
+        )
+        assert (np.asarray(Image.open(path)).astype(np.uint16) == expected).all()
+
+
+def test_export_image_writes_rgb_arrays(tmp_path):
+    from PIL import Image
+
+    rgb = np.random.default_rng(0).random((40, 30, 3))
+    path = NoiseExporter(tmp_path).export_image(rgb, "rgb", "tiff", compression=6)
+    assert (np.asarray(Image.open(path)) == (rgb * 255).astype(np.uint8)).all()
+
+
+def test_export_audio_streams_generator_blocks_to_wav(tmp_path):
+    from scipy.io import wavfile
+
+    from engine.audio_noise import AudioNoiseGenerator
+
+    expected = AudioNoiseGenerator(8000, seed=2, channels=2).generate_white_noise(1.0, amplitude=0.5)
+    exporter = NoiseExporter(tmp_path)
+    for bit_depth, scale in ((16, 32767), (24, 8388607 * 256)):
+        blocks = AudioNoiseGenerator(8000, seed=2, channels=2).stream(1000, "white", 8000)
+        path = exporter.export_audio(
+            (block * 0.5 for block in blocks), f"noise_{bit_depth}", 8000, bit_depth=bit_depth,
+        )
+        rate, data = wavfile.read(path)
+        assert rate == 8000 and data.shape == (8000, 2)
+        assert np.abs(data / scale - expected).max() < 1e-4
+
+    path = exporter.export_audio(expected[:, 0], "float", 8000, bit_depth=32)
+    assert (wavfile.read(path)[1] == expected[:, 0].astype(np.float32)).all()
+
+
+def test_export_audio_dither_stays_within_one_lsb(tmp_path):
+    from scipy.io import wavfile
+
+    audio = np.full(20000, 0.25 / 32767)
+    path = NoiseExporter(tmp_path).export_audio(audio, "dithered", 8000, dither=True)
+    data = wavfile.read(path)[1]
+    assert set(np.unique(data)) <= {-1, 0, 1}
+    assert abs(data.mean() - 0.25) < 0.02
+
+
+def test_export_image_uses_cached_render_without_rendering(tmp_path):
+    from PIL import Image
+
+    from engine.render_cache import RenderCache, render_key
+
+    cache = RenderCache()
+    key = render_key("image", "perlin", {"width": 20, "height": 10, "scale": 2.0}, 3, np.float64)
+    image = ImageNoiseGenerator(20, 10, seed=3).generate_perlin_noise(scale=2.0)
+    cache.put(key, image)
+
+    def tiles():
+        raise AssertionError("tiles rendered despite a cache hit")
+        yield
+
+    path = NoiseExporter(tmp_path, cache=cache).export_image(
+        tiles(), "cached", width=20, height=10, cache_key=key,
+    )
+    assert (np.asarray(Image.open(path)) == (image * 255).astype(np.uint8)).all()
+
+
+def _wav_chunks(path):
+    import struct
+
+    raw = path.read_bytes()
+    chunks, offset = {}, 12
+    while b"data" not in chunks:
+        kind, size = struct.unpack_from("<4sI", raw, offset)
+        chunks[kind] = (offset + 8, size)
+        offset += 8 + size + size % 2
+    return raw, chunks
+
+
+def test_wav_writer_float_fact_chunk_and_rf64_header(tmp_path, monkeypatch):
+    import struct
+
+    from export import exporter
+
+    frames = np.random.default_rng(1).uniform(-1, 1, (1001, 2))
+    with exporter.WavWriter(tmp_path / "small.wav", 8000, channels=2, bit_depth=32) as writer:
+        writer.write(frames)
+    raw, chunks = _wav_chunks(tmp_path / "small.wav")
+    assert raw[:4] == b"RIFF" and struct.unpack_from("<I", raw, 4)[0] == len(raw) - 8
+    fact_offset, fact_size = chunks[b"fact"]
+    assert fact_size == 4 and struct.unpack_from("<I", raw, fact_offset)[0] == 1001
+
+    monkeypatch.setattr(exporter, "_RIFF_LIMIT", 1000)
+    with exporter.WavWriter(tmp_path / "big.wav", 8000, channels=2, bit_depth=32) as writer:
+        writer.write(frames)
+    raw, chunks = _wav_chunks(tmp_path / "big.wav")
+    assert raw[:4] == b"RF64" and struct.unpack_from("<I", raw, 4)[0] == 0xFFFFFFFF
+    ds64_offset, ds64_size = chunks[b"ds64"]
+    riff_size, data_size, sample_count = struct.unpack_from("<QQQ", raw, ds64_offset)
+    assert ds64_size == 28
+    assert (riff_size, data_size, sample_count) == (len(raw) - 8, 1001 * 2 * 4, 1001)
+    assert struct.unpack_from("<I", raw, chunks[b"fact"][0])[0] == 0xFFFFFFFF
+    data_offset, data_field = chunks[b"data"]
+    assert data_field == 0xFFFFFFFF
+    samples = np.frombuffer(raw, "<f4", 1001 * 2, data_offset)
+    assert (samples.reshape(-1, 2) == frames.astype(np.float32)).all()
@@ -1,4 +1,7 @@
-from engine.image_noise import ImageNoiseGenerator
+import numpy as np
+import pytest
+
+from engine.image_noise import ImageNoiseGenerator, spectral_plan
 
 
 def test_white_noise_shape_and_range():
@@ -6,3 +9,145 @@ def test_white_noise_shape_and_range():
     arr = gen.generate_white_noise()
     assert arr.shape == (32, 64)
     assert arr.min() >= 0.0 and arr.max() <= 1.0
+
+
+def test_perlin_noise_shape_range_and_determinism():
+    gen = ImageNoiseGenerator(96, 48, seed=7)
+    arr = gen.generate_perlin_noise(scale=4.0, octaves=4)
+    assert arr.shape == (48, 96)
+    assert arr.min() >= 0.0 and arr.max() <= 1.0
+    assert arr.std() > 0.0
+
+    again = ImageNoiseGenerator(96, 48, seed=7).generate_perlin_noise(scale=4.0, octaves=4)
+    other = ImageNoiseGenerator(96, 48, seed=8).generate_perlin_noise(scale=4.0, octaves=4)
+    assert (arr == again).all()
+    assert not (arr == other).all()
+
+
+def test_perlin_noise_is_smooth():
+    gen = ImageNoiseGenerator(128, 128, seed=3)
+    arr = gen.generate_perlin_noise(scale=2.0, octaves=1)
+    # Low-frequency gradient noise changes little between neighbouring pixels.
+    assert abs(arr[:, 1:] - arr[:, :-1]).max() < 0.05
+
+
+def test_simplex_noise_2d_and_3d():
+    gen = ImageNoiseGenerator(64, 32, seed=5)
+    flat = gen.generate_simplex_noise(scale=3.0, octaves=3)
+    assert flat.shape == (32, 64)
+    assert flat.min() >= 0.0 and flat.max() <= 1.0
+    assert (flat == ImageNoiseGenerator(64, 32, seed=5).generate_simplex_noise(3.0, 3)).all()
+
+    volume = gen.generate_simplex_noise_3d(4, scale=3.0, octaves=2)
+    assert volume.shape == (4, 32, 64)
+    assert volume.min() >= 0.0 and volume.max() <= 1.0
+    # Consecutive frames evolve smoothly instead of being independent.
+    assert abs(volume[1] - volume[0]).mean() < abs(volume[0] - volume[0].mean()).mean()
+
+
+def test_tiles_join_seamlessly():
+    gen = ImageNoiseGenerator(100, 70, seed=11)
+    for noise_type in ("perlin", "simplex"):
+        full = gen.generate_tile(noise_type, 0, 0, 100, 70, scale=5.0, octaves=3)
+        tiled = full * 0.0
+        for x, y, tile in gen.iter_tiles(noise_type, tile_size=32, scale=5.0, octaves=3):
+            tiled[y:y + tile.shape[0], x:x + tile.shape[1]] = tile
+        assert (tiled == full).all()
+
+
+def test_white_noise_tiles_are_deterministic():
+    a = ImageNoiseGenerator(64, 64, seed=2).generate_tile("white", 32, 0, 32, 32)
+    b = ImageNoiseGenerator(64, 64, seed=2).generate_tile("white", 32, 0, 32, 32)
+    c = ImageNoiseGenerator(64, 64, seed=2).generate_tile("white", 0, 32, 32, 32)
+    full = ImageNoiseGenerator(64, 64, seed=2).generate_white_noise()
+    assert (a == b).all()
+    assert not (a == c).all()
+    assert (a == full[0:32, 32:64]).all()
+    assert (c == full[32:64, 0:32]).all()
+
+
+def test_band_parallel_render_matches_for_any_worker_count():
+    gen = ImageNoiseGenerator(80, 150, seed=9)
+    for noise_type, params in (("white", {}), ("perlin", {"scale": 4.0, "octaves": 2})):
+        serial = gen.render(noise_type, workers=1, band_height=16, **params)
+        threaded = gen.render(noise_type, workers=4, band_height=16, **params)
+        assert (serial == threaded).all()
+    assert (gen.generate_perlin_noise(4.0, 2, workers=3) == gen.generate_perlin_noise(4.0, 2)).all()
+
+
+def test_worley_noise_outputs_and_tiles():
+    gen = ImageNoiseGenerator(72, 40, seed=6)
+    f1 = gen.generate_worley_noise(scale=6.0, output="f1")
+    f2 = gen.generate_worley_noise(scale=6.0, output="f2")
+    assert f1.shape == (40, 72)
+    assert f1.min() >= 0.0 and f2.max() <= 1.0
+    assert (f2 >= f1).all()
+
+    edges = gen.generate_worley_noise(scale=6.0, output="f2-f1", metric="manhattan")
+    tiled = edges * 0.0
+    for x, y, tile in gen.iter_tiles("worley", tile_size=16, scale=6.0, output="f2-f1", metric="manhattan"):
+        tiled[y:y + tile.shape[0], x:x + tile.shape[1]] = tile
+    assert (tiled == edges).all()
+
+
+def test_generators_fill_float32_out_buffers():
+    gen = ImageNoiseGenerator(40, 24, seed=1)
+    buf = np.empty((24, 40), dtype=np.float32)
+    for fill in (gen.generate_white_noise, gen.generate_perlin_noise,
+                 gen.generate_simplex_noise, gen.generate_worley_noise):
+        result = fill(out=buf)
+        assert result is buf
+        assert buf.min() >= 0.0 and buf.max() <= 1.0
+    assert gen.generate_perlin_noise(dtype=np.float32).dtype == np.float32
+    with pytest.raises(ValueError):
+        gen.generate_white_noise(out=np.empty((10, 10), dtype=np.float32))
+
+
+def test_colored_noise_spectral_slope_and_plan_reuse():
+    gen = ImageNoiseGenerator(128, 96, seed=12)
+    brown = gen.generate_brown_noise()
+    assert brown.shape == (96, 128)
+    assert brown.min() == 0.0 and brown.max() == 1.0
+
+    power = abs(np.fft.rfft2(brown - brown.mean())) ** 2
+    fy = np.fft.fftfreq(96)[:, None]
+    fx = np.fft.rfftfreq(128)[None, :]
+    radius = np.sqrt(fx * fx + fy * fy)
+    band = (radius > 0.02) & (radius < 0.4)
+    slope = np.polyfit(np.log(radius[band]), np.log(power[band]), 1)[0]
+    assert -2.5 < slope < -1.5
+
+    buf = np.empty((96, 128), dtype=np.float32)
+    assert gen.generate_pink_noise(out=buf) is buf
+    assert spectral_plan(96, 128) is spectral_plan(96, 128)
+
+
+def test_generate_batch_matches_single_seed_renders():
+    gen = ImageNoiseGenerator(40, 24)
+    pink = gen.generate_batch([5, 6], "pink", dtype=np.float32)
+    perlin = gen.generate_batch([5, 6], "perlin", scale=3.0, octaves=2)
+    assert pink.shape == perlin.shape == (2, 24, 40)
+    for i, seed in enumerate([5, 6]):
+        single = ImageNoiseGenerator(40, 24, seed=seed)
+        assert (pink[i] == single.generate_pink_noise(dtype=np.float32)).all()
+        assert (perlin[i] == single.generate_perlin_noise(scale=3.0, octaves=2)).all()
+
+
+@pytest.mark.parametrize("noise_type, params", [
+    ("white", {}),
+    ("perlin", {"scale": 0.5}),
+    ("simplex", {"scale": 4.0, "octaves": 3}),
+    ("worley", {"scale": 5.0, "output": "f2-f1"}),
+])
+def test_generate_batch_renders_all_seeds_in_one_pass(noise_type, params):
+    batch = ImageNoiseGenerator(70, 33).generate_batch([1, 2, 3], noise_type, dtype=np.float32, **params)
+    for seed, image in zip([1, 2, 3], batch):
+        single = ImageNoiseGenerator(70, 33, seed=seed).render(noise_type, dtype=np.float32, **params)
+        assert (image == single).all()
+
+
+@pytest.mark.parametrize("noise_type", ["white", "pink", "perlin", "simplex", "worley"])
+def test_generate_batch_with_no_seeds_is_empty(noise_type):
+    batch = ImageNoiseGenerator(70, 33).generate_batch([], noise_type, dtype=np.float32)
+    assert batch.shape == (0, 33, 70)
+    assert batch.dtype == np.float32
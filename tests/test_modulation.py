@@ -0,0 +1,35 @@
+import numpy as np
+
+from engine.audio_noise import AudioNoiseGenerator
+from engine.modulation import LFO, Envelope, ModulatedNoise
+
+
+def make_modulated(channels=1):
+    return ModulatedNoise(
+        AudioNoiseGenerator(sample_rate=8000, seed=2, channels=channels),
+        "white",
+        amplitude=LFO(0.5, 0.2, 1.0),
+        cutoff=Envelope([0.0, 2.0], [100.0, 3000.0]),
+    )
+
+
+def test_modulators_follow_their_shapes():
+    indices = np.array([0, 2000, 4000, 6000])
+    assert np.allclose(LFO(1.0, 2.0, 4.0).at(indices, 8000), [3.0, 4.0, 3.0, 2.0])
+    assert np.allclose(LFO(1.0, shape="triangle").at(indices, 8000), [0.5, 1.0, 0.5, 0.0])
+    assert np.allclose(Envelope([0.0, 1.0], [10.0, 20.0]).at(indices, 4000), [10, 15, 20, 20])
+
+
+def test_modulated_blocks_match_one_shot_render():
+    one_shot = make_modulated(channels=2).generate(3.0)
+    blocks = list(make_modulated(channels=2).stream(700, len(one_shot)))
+    assert np.allclose(np.concatenate(blocks), one_shot, atol=1e-5)
+
+
+def test_cutoff_sweep_opens_the_filter():
+    audio = make_modulated().generate(4.0)
+    early = np.abs(np.fft.rfft(audio[:4000])) ** 2
+    late = np.abs(np.fft.rfft(audio[-4000:])) ** 2
+    freqs = np.fft.rfftfreq(4000, 1 / 8000)
+    high = freqs > 1500
+    assert late[high].sum() / late.sum() > 10 * early[high].sum() / early.sum()
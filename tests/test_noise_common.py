@@ -0,0 +1,13 @@
+import numpy as np
+
+from engine.noise_common import counter_key, counter_uniform, seed_entropy
+
+
+def test_counter_uniform_ranges_match_full_stream():
+    key = counter_key(seed_entropy(5))
+    full = counter_uniform(key, 0, 1000)
+    assert 0.0 <= full.min() and full.max() < 1.0
+    assert (counter_uniform(key, 123, 456) == full[123:579]).all()
+    single = counter_uniform(key, 0, 1000, dtype=np.float32)
+    assert (counter_uniform(key, 7, 10, dtype=np.float32) == single[7:17]).all()
+    assert not (counter_uniform(counter_key(seed_entropy(6)), 0, 1000) == full).all()
@@ -1,3 +1,5 @@
+import numpy as np
+
 from ui.panels.image_panel import ImagePanel
 from ui.panels.sound_panel import SoundPanel
 
@@ -10,6 +12,31 @@ def test_image_panel_resolution_change_no_live_preview():
     assert p.current_image is None
 
 
+def test_image_panel_resolution_change_releases_spectral_plans():
+    from engine.image_noise import spectral_plan
+
+    p = ImagePanel()
+    p.live_preview = False
+    plan = spectral_plan(p.height, p.width)
+    p.on_resolution_changed(p.width, p.height)
+    assert spectral_plan(p.height, p.width) is plan
+    p.on_resolution_changed(128, 96)
+    assert spectral_plan(512, 512) is not plan
+
+
+def test_image_panel_current_image_survives_next_generation():
+    p = ImagePanel()
+    p.live_preview = False
+    p.on_resolution_changed(32, 24)
+    p._autosave = lambda image_data: None
+    p.on_generate_clicked()
+    first = p.get_current_image()
+    snapshot = first.copy()
+    p.on_generate_clicked()
+    assert p.get_current_image() is not first
+    assert (first == snapshot).all()
+
+
 def test_sound_panel_generate_noise_normalized():
     s = SoundPanel()
     s.duration = 0.2
@@ -18,3 +45,128 @@ def test_sound_panel_generate_noise_normalized():
     assert audio is not None
     assert len(audio) == int(16000 * 0.2)
     assert abs(audio).max() <= 1.0
+
+
+class _FakePlayer:
+    def __init__(self, sample_rate, channels):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.plays = 0
+        self.swaps = 0
+        self.blocks = None
+        self.stopped = False
+
+    def play(self, blocks):
+        self.plays += 1
+        self.blocks = blocks
+        self.stopped = False
+
+    def swap(self, blocks):
+        self.swaps += 1
+
+    def stop(self):
+        self.stopped = True
+
+    def is_playing(self):
+        return self.plays > 0 and not self.stopped
+
+
+def test_sound_panel_live_preview_replays_cached_loop():
+    s = SoundPanel()
+    s.duration = 0.2
+    s.sample_rate = 16000
+    s._player = player = _FakePlayer(16000, 1)
+    s.refresh_live_preview()
+    loop = s.get_current_audio()
+    assert player.plays == 1 and len(loop) == int(16000 * 0.2)
+
+    s.refresh_live_preview()
+    assert player.plays == 1 and player.swaps == 0
+
+    s.on_noise_type_changed("pink")
+    s.on_noise_type_changed("white")
+    assert player.swaps == 2
+    assert s.get_current_audio() is loop
+
+
+def test_sound_panel_reuses_cached_seeded_render(monkeypatch):
+    from engine import render_cache
+
+    # A fresh shared cache for this test only; monkeypatch restores the old one
+    cache = render_cache.RenderCache()
+    monkeypatch.setattr(render_cache, "_default_cache", cache)
+    s = SoundPanel()
+    s.duration = 0.1
+    s.sample_rate = 8000
+    s.seed = 11
+    first = s.generate_noise()
+    second = s.generate_noise()
+    assert (first == second).all() and cache.hits == 1
+
+    s.seed = None
+    s.generate_noise()
+    s.generate_noise()
+    assert cache.hits == 1
+
+
+def test_sound_panel_playback_and_clip_share_a_fixed_gain():
+    from engine.audio_noise import AudioNoiseGenerator
+
+    s = SoundPanel()
+    s.duration = 2.0
+    s.sample_rate = 8000
+    s.seed = 5
+    s.noise_type = "brown"
+    s._autosave = lambda audio: None
+    s._player = player = _FakePlayer(8000, 1)
+    s.play_audio()
+    played = np.concatenate(list(player.blocks))
+
+    brown = AudioNoiseGenerator(8000, seed=5).generate_brown_noise(2.0, dtype=np.float32)
+    expected = np.clip(brown * np.float32(0.8), -1.0, 1.0)
+    assert (played == expected).all()
+    assert (s.generate_noise() == expected).all()
+
+
+def test_sound_panel_replays_seeded_clip_from_render_cache(monkeypatch):
+    from engine import render_cache
+
+    cache = render_cache.RenderCache()
+    monkeypatch.setattr(render_cache, "_default_cache", cache)
+    s = SoundPanel()
+    s.duration = 0.5
+    s.sample_rate = 8000
+    s.seed = 12
+    saved = []
+    s._autosave = saved.append
+    s._player = player = _FakePlayer(8000, 1)
+
+    s.play_audio()
+    first = np.concatenate(list(player.blocks))
+    s.play_audio()
+    second = np.concatenate(list(player.blocks))
+    assert (first == second).all()
+    assert len(saved) == 1 and cache.hits == 1
+
+    s.loop_preview = True
+    s.play_loop()
+    loop = s.get_current_audio()
+    s._loops.clear()
+    s.stop_audio()
+    s.play_loop()
+    assert (s.get_current_audio() == loop).all() and cache.hits == 2
+
+
+def test_sound_panel_live_preview_toggle_starts_loop_and_stops_it():
+    s = SoundPanel()
+    s.duration = 0.2
+    s.sample_rate = 16000
+    s._player = player = _FakePlayer(16000, 1)
+    s.set_live_preview(True)
+    assert player.plays == 1 and s._is_playing()
+    assert s._playing_loop is not None
+
+    s.set_live_preview(False)
+    assert not s._is_playing()
+    s.refresh_live_preview()
+    assert player.plays == 1 and not s._is_playing()
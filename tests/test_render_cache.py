@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+
+from engine.render_cache import RenderCache, render_key
+
+
+def test_render_key_is_canonical_and_skips_unseeded_renders():
+    key = render_key("image", "perlin", {"scale": 4, "octaves": 2}, 7, np.float32)
+    assert key == render_key("image", "perlin", {"octaves": 2.0, "scale": 4.0}, 7, "float32")
+    assert key != render_key("image", "perlin", {"scale": 4, "octaves": 2}, 8, np.float32)
+    assert key != render_key("image", "perlin", {"scale": 4, "octaves": 2}, 7, np.float64)
+    assert render_key("image", "perlin", {"scale": 4}, None) is None
+
+
+def test_memory_tier_is_an_lru_bounded_by_bytes():
+    cache = RenderCache(max_bytes=2 * 800)
+    for name in "abc":
+        cache.put(name, np.zeros(100))
+        cache.get("a")
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert not cache.get("a").flags.writeable
+
+    cache.put(None, np.zeros(10))
+    cache.put("huge", np.zeros(1000))
+    assert cache.get(None) is None and cache.get("huge") is None
+
+
+def test_disk_tier_survives_a_new_cache_and_evicts_old_files(tmp_path):
+    data = np.arange(12, dtype=np.float32).reshape(3, 4)
+    RenderCache(directory=tmp_path).put("k1", data)
+    fresh = RenderCache(directory=tmp_path)
+    assert (fresh.get("k1") == data).all()
+    os.utime(tmp_path / "k1.npy", (0, 0))
+
+    small = RenderCache(directory=tmp_path, max_disk_bytes=data.nbytes + 200)
+    small.put("k2", data)
+    assert sorted(p.stem for p in tmp_path.glob("*.npy")) == ["k2"]
+
+
+def test_disk_writes_can_go_through_a_background_queue(tmp_path):
+    jobs = []
+    cache = RenderCache(directory=tmp_path, submit=lambda func, *args, **options: jobs.append((func, args)))
+    cache.put("k1", np.ones(4))
+    assert not list(tmp_path.glob("*.npy"))
+    assert (cache.get("k1") == 1).all()
+
+    for func, args in jobs:
+        func(*args)
+    assert (RenderCache(directory=tmp_path).get("k1") == 1).all()
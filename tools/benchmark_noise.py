@@ -0,0 +1,282 @@
+"""
+Noise engine benchmarks.
+
+Usage:
+    python tools/benchmark_noise.py            # run every benchmark
+    python tools/benchmark_noise.py perlin     # run selected benchmarks
+
+Each benchmark is timed against a wall-clock budget; the script exits
+with a non-zero status if any budget is exceeded.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import numpy as np  # noqa: E402
+
+from engine.audio_noise import AudioNoiseGenerator  # noqa: E402
+from engine.image_noise import ImageNoiseGenerator  # noqa: E402
+from engine.modulation import LFO, Envelope, ModulatedNoise  # noqa: E402
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str, budget_seconds: float):
+    """
+    Register a benchmark function under `name` with a time budget.
+    """
+    def register(func):
+        BENCHMARKS[name] = (func, budget_seconds)
+        return func
+    return register
+
+
+# Most the seekable white noise paths may cost relative to plain
+# sequential draws (numpy.random.default_rng().random) of the same size.
+WHITE_MAX_SLOWDOWN = 1.5
+
+
+def _seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _check_white_slowdown(name, reference, timings):
+    """Print white noise timings against `reference` and fail past the limit."""
+    ratios = {label: seconds / reference for label, seconds in timings.items()}
+    print(f"[BENCH] {name}: " + ", ".join(f"{r:.2f}x ({label})" for label, r in ratios.items())
+          + " of default_rng")
+    if max(ratios.values()) > WHITE_MAX_SLOWDOWN:
+        raise AssertionError(f"white noise must cost at most {WHITE_MAX_SLOWDOWN}x default_rng draws.")
+
+
+@benchmark("white", budget_seconds=1.0)
+def bench_white():
+    """4096x4096 white noise in float64 and into a float32 buffer, against default_rng."""
+    gen = ImageNoiseGenerator(4096, 4096, seed=1)
+    buf = np.empty((4096, 4096), dtype=np.float32)
+    gen.generate_white_noise(out=buf)  # warm up
+    reference = _seconds(lambda: np.random.default_rng(1).random((4096, 4096)))
+    _check_white_slowdown("white", reference, {
+        "float64": _seconds(gen.generate_white_noise),
+        "float32": _seconds(lambda: gen.generate_white_noise(out=buf)),
+    })
+
+
+@benchmark("perlin", budget_seconds=5.0)
+def bench_perlin():
+    """4096x4096 Perlin fBm with 8 octaves."""
+    gen = ImageNoiseGenerator(4096, 4096, seed=1)
+    gen.generate_perlin_noise(scale=4.0, octaves=8)
+
+
+@benchmark("perlin_parallel", budget_seconds=5.0)
+def bench_perlin_parallel():
+    """4096x4096 Perlin fBm with 8 octaves, one band worker per core."""
+    gen = ImageNoiseGenerator(4096, 4096, seed=1)
+    gen.generate_perlin_noise(scale=4.0, octaves=8, workers=os.cpu_count() or 1)
+
+
+@benchmark("simplex", budget_seconds=5.0)
+def bench_simplex():
+    """2048x2048 simplex fBm with 8 octaves, reported against Perlin on the same canvas."""
+    gen = ImageNoiseGenerator(2048, 2048, seed=1)
+    perlin = _seconds(lambda: gen.generate_perlin_noise(scale=4.0, octaves=8))
+    simplex = _seconds(lambda: gen.generate_simplex_noise(scale=4.0, octaves=8))
+    print(f"[BENCH] simplex: {simplex / perlin:.1f}x the time of Perlin")
+
+
+@benchmark("simplex_3d", budget_seconds=5.0)
+def bench_simplex_3d():
+    """64 animation frames of 256x256 3D simplex fBm with 4 octaves."""
+    gen = ImageNoiseGenerator(256, 256, seed=1)
+    gen.generate_simplex_noise_3d(64, scale=4.0, octaves=4)
+
+
+@benchmark("worley", budget_seconds=5.0)
+def bench_worley():
+    """4096x4096 Worley F2-F1 with 32 cells across."""
+    gen = ImageNoiseGenerator(4096, 4096, seed=1)
+    gen.generate_worley_noise(scale=32.0, output="f2-f1")
+
+
+@benchmark("pink_preview", budget_seconds=5.0)
+def bench_pink_preview():
+    """Ten repeated 2048x2048 float32 pink noise previews."""
+    gen = ImageNoiseGenerator(2048, 2048, seed=1)
+    buf = np.empty((2048, 2048), dtype=np.float32)
+    for _ in range(10):
+        gen.generate_pink_noise(out=buf)
+
+
+@benchmark("white_audio_stream", budget_seconds=1.0)
+def bench_white_audio_stream():
+    """Ten minutes of 44.1 kHz white noise in one-second blocks, against default_rng."""
+    buf = np.empty(44100, dtype=np.float32)
+
+    def stream(dtype):
+        gen = AudioNoiseGenerator(44100, seed=1)
+        for _ in range(600):
+            gen.generate_white_noise(1.0, dtype=dtype)
+
+    def stream_into_buffer():
+        gen = AudioNoiseGenerator(44100, seed=1)
+        for _ in range(600):
+            gen.generate_white_noise(1.0, out=buf)
+
+    def reference():
+        rng = np.random.default_rng(1)
+        for _ in range(600):
+            rng.random(44100) * 2.0 - 1.0
+
+    _check_white_slowdown("white_audio_stream", _seconds(reference), {
+        "float64": _seconds(lambda: stream(np.float64)),
+        "float32": _seconds(stream_into_buffer),
+    })
+
+
+@benchmark("pink_audio_stream", budget_seconds=5.0)
+def bench_pink_audio_stream():
+    """Ten minutes of 44.1 kHz pink noise rendered in one-second blocks."""
+    gen = AudioNoiseGenerator(44100, seed=1)
+    buf = np.empty(44100, dtype=np.float32)
+    for _ in range(600):
+        gen.generate_pink_noise(1.0, out=buf)
+
+
+@benchmark("brown_audio_stream", budget_seconds=5.0)
+def bench_brown_audio_stream():
+    """Ten minutes of 44.1 kHz brown noise rendered in one-second blocks."""
+    gen = AudioNoiseGenerator(44100, seed=1)
+    buf = np.empty(44100, dtype=np.float32)
+    for _ in range(600):
+        gen.generate_brown_noise(1.0, out=buf)
+
+
+# Minimum speed-up of 2000 pulses/s velvet noise over white noise, for
+# dense samples and for the sparse pulse form. A one-second block costs
+# a few dozen NumPy calls, so velvet runs about 4.5-5x (dense) and
+# 5.5-8x (sparse) faster than white rather than the 22x its pulse count
+# alone would allow.
+VELVET_DENSE_SPEEDUP = 4.0
+VELVET_SPARSE_SPEEDUP = 5.0
+
+
+@benchmark("velvet_audio_stream", budget_seconds=5.0)
+def bench_velvet_audio_stream():
+    """
+    Ten minutes of 44.1 kHz velvet noise at 2000 pulses/s in one-second
+    blocks, dense and sparse, checked against the same stream of white noise.
+    """
+    buf = np.empty(44100, dtype=np.float32)
+
+    def stream_seconds(render):
+        gen = AudioNoiseGenerator(44100, seed=1)
+        start = time.perf_counter()
+        for _ in range(600):
+            render(gen)
+        return time.perf_counter() - start
+
+    white = stream_seconds(lambda gen: gen.generate_white_noise(1.0, out=buf))
+    dense = white / stream_seconds(lambda gen: gen.generate_velvet_noise(1.0, out=buf))
+    sparse = white / stream_seconds(lambda gen: gen.generate_velvet_pulses(1.0))
+    print(f"[BENCH] velvet_audio_stream: {dense:.1f}x (dense), {sparse:.1f}x (sparse) faster than white")
+    if dense < VELVET_DENSE_SPEEDUP or sparse < VELVET_SPARSE_SPEEDUP:
+        raise AssertionError(
+            f"velvet noise must be {VELVET_DENSE_SPEEDUP}x (dense) and "
+            f"{VELVET_SPARSE_SPEEDUP}x (sparse) faster than white noise."
+        )
+
+
+@benchmark("shaped_audio_stream", budget_seconds=5.0)
+def bench_shaped_audio_stream():
+    """Ten minutes of 96 kHz noise shaped to an EQ curve, in one-second blocks."""
+    gen = AudioNoiseGenerator(96000, seed=1)
+    gen.set_spectral_curve([0, 100, 1000, 10000, 48000], [1.0, 3.0, 1.0, 0.5, 0.1])
+    buf = np.empty(96000, dtype=np.float32)
+    for _ in range(600):
+        gen.generate_shaped_noise(1.0, out=buf)
+
+
+@benchmark("modulated_audio_stream", budget_seconds=5.0)
+def bench_modulated_audio_stream():
+    """Ten minutes of 48 kHz pink noise with an LFO and a cutoff sweep, in one-second blocks."""
+    noise = ModulatedNoise(
+        AudioNoiseGenerator(48000, seed=1),
+        "pink",
+        amplitude=LFO(0.1, 0.4, 1.0),
+        cutoff=Envelope([0.0, 300.0, 600.0], [200.0, 8000.0, 200.0]),
+    )
+    buf = np.empty(48000, dtype=np.float32)
+    for _ in range(600):
+        noise.fill(buf)
+
+
+@benchmark("pink_audio_parallel", budget_seconds=5.0)
+def bench_pink_audio_parallel():
+    """Thirty minutes of 44.1 kHz pink noise, one worker process per core."""
+    gen = AudioNoiseGenerator(44100, seed=1)
+    gen.render_parallel(1800.0, "pink", workers=os.cpu_count() or 1, dtype=np.float32)
+
+
+# Worker count of the parallel scaling check, and the least speed-up over
+# one worker it must reach; machines with fewer cores skip the check.
+PARALLEL_WORKERS = 4
+PARALLEL_MIN_SPEEDUP = 2.0
+
+
+@benchmark("pink_audio_parallel_scaling", budget_seconds=10.0)
+def bench_pink_audio_parallel_scaling():
+    """
+    Ten minutes of 44.1 kHz pink noise on one worker and on
+    PARALLEL_WORKERS worker processes, checked for a minimum speed-up.
+    """
+    if (os.cpu_count() or 1) < PARALLEL_WORKERS:
+        print(f"[BENCH] pink_audio_parallel_scaling: skipped, needs {PARALLEL_WORKERS} cores")
+        return
+
+    def render_seconds(workers):
+        gen = AudioNoiseGenerator(44100, seed=1)
+        return _seconds(lambda: gen.render_parallel(600.0, "pink", workers=workers, dtype=np.float32))
+
+    render_seconds(PARALLEL_WORKERS)  # start the worker processes
+    speedup = render_seconds(1) / render_seconds(PARALLEL_WORKERS)
+    print(f"[BENCH] pink_audio_parallel_scaling: {speedup:.1f}x on {PARALLEL_WORKERS} workers")
+    if speedup < PARALLEL_MIN_SPEEDUP:
+        raise AssertionError(
+            f"{PARALLEL_WORKERS} workers must render at least {PARALLEL_MIN_SPEEDUP}x faster than one."
+        )
+
+
+def run(names):
+    failed = []
+    for name in names:
+        func, budget = BENCHMARKS[name]
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        print(f"[BENCH] {name}: {elapsed:.3f}s (budget {budget:.1f}s) {status}")
+        if elapsed > budget:
+            failed.append(name)
+    return failed
+
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmark(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(BENCHMARKS)}")
+        return 2
+    return 1 if run(names) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())